@@ -1,28 +1,130 @@
-from typing import Any, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypedDict
 from datetime import datetime, timezone
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from pydantic.generics import GenericModel
 from typing import Generic, TypeVar
 
 T = TypeVar('T')
+M = TypeVar('M', bound=BaseModel)
+
+_UTC = timezone.utc
+
+
+def utc_now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string.
+
+    Response timestamps are only ever emitted as JSON, so they are produced
+    already formatted instead of as `datetime` objects that Pydantic would
+    validate and encode again on every response.
+
+    Returns:
+        str: Current UTC timestamp in ISO 8601 format.
+    """
+    return datetime.now(_UTC).isoformat()
+
+
+# --- ORM to schema conversion ---
+@lru_cache(maxsize=None)
+def _field_names(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """
+    Return the declared field names of a schema, computed once per class.
+
+    Args:
+        model (Type[BaseModel]): The schema class.
+
+    Returns:
+        Tuple[str, ...]: Field names in declaration order.
+    """
+    return tuple(model.model_fields)
+
+
+@lru_cache(maxsize=None)
+def _field_reader(model: Type[BaseModel]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Return a function that reads a schema's fields off an object, built once per class.
+
+    The field names are bound into a single `attrgetter`, which fetches all of
+    them in one C-level call instead of a `getattr` per field in Python.
+
+    Args:
+        model (Type[BaseModel]): The schema class.
+
+    Returns:
+        Callable[[Any], Dict[str, Any]]: Maps an object to `{field name: attribute value}`.
+    """
+    names = _field_names(model)
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        return lambda obj: {names[0]: getter(obj)}
+    return lambda obj: dict(zip(names, getter(obj)))
+
+
+class ORMConstructMixin:
+    """
+    Mixin for response schemas built from trusted ORM rows.
+
+    Rows loaded from the database already carry the column types the schema
+    declares, so running the validators over them (`model_validate` with
+    `from_attributes`) only re-checks what the ORM guarantees. `from_orm_fast`
+    reads each declared field off the row and builds the model with
+    `model_construct`; use `model_validate` for anything not coming from the ORM.
+    """
+
+    @classmethod
+    def from_orm_fast(cls: Type[M], obj: Any) -> M:
+        """
+        Build the schema from an ORM instance (or result row) without validation.
+
+        Args:
+            obj (Any): Object exposing every schema field as an attribute.
+
+        Returns:
+            M: The constructed schema instance.
+        """
+        return cls.model_construct(**_field_reader(cls)(obj))
 
 
 # --- Success Response ---
-class ResponseSchema(GenericModel, Generic[T]):
+class ResponseSchema(BaseModel, Generic[T]):
     """
     Standardized schema for successful API responses.
 
     Attributes:
         status (str): Indicates the response status. Always set to `'success'`.
-        timestamp (datetime): The UTC timestamp of when the response was created.
+        timestamp (str): The ISO 8601 UTC timestamp of when the response was created.
         data (T): The response payload containing the requested resource or result.
     """
 
     status: str = 'success'
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: str = Field(default_factory=utc_now_iso, json_schema_extra={'format': 'date-time'})
     data: T
 
 
+def success_response(data: Any, status_code: int = 200) -> ORJSONResponse:
+    """
+    Build a success response envelope around already JSON-ready data.
+
+    Returning a Response skips FastAPI's `response_model` validation and
+    serialization, so large payloads (lists) are encoded once by orjson
+    instead of being validated again through ResponseSchema. Routes keep their
+    `response_model` for the OpenAPI docs.
+
+    Args:
+        data (Any): JSON-compatible payload, e.g. `model_dump(mode='json')` output.
+        status_code (int, optional): HTTP status code. Defaults to 200.
+
+    Returns:
+        ORJSONResponse: Response shaped like ResponseSchema.
+    """
+    return ORJSONResponse(
+        {'status': 'success', 'timestamp': utc_now_iso(), 'data': data},
+        status_code=status_code
+    )
+
+
 # --- Error Response ---
 class ErrorSchema(BaseModel):
     """
@@ -30,14 +132,33 @@ class ErrorSchema(BaseModel):
 
     Attributes:
         status (str): Indicates the response status. Always set to `'error'`.
-        timestamp (datetime): The UTC timestamp of when the error occurred.
+        timestamp (str): The ISO 8601 UTC timestamp of when the error occurred.
         message (str): A short human-readable description of the error.
         details (Optional[str]): Additional technical or contextual details (optional).
     """
 
     status: str = 'error'
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: str = Field(default_factory=utc_now_iso, json_schema_extra={'format': 'date-time'})
     message: str
     details: Optional[List[Any]] = None
 
-    model_config = {'json_encoders': {datetime: lambda v: v.isoformat()}}
\ No newline at end of file
+
+class ErrorPayload(TypedDict):
+    """
+    Wire shape of an error response, mirroring ErrorSchema.
+
+    Error payloads are built from trusted application values on every failed
+    request, so they are typed as a TypedDict (a plain dict at runtime) rather
+    than validated through ErrorSchema.
+
+    Attributes:
+        status (str): Always `'error'`.
+        timestamp (str): The ISO 8601 UTC timestamp of when the error occurred.
+        message (str): A short human-readable description of the error.
+        details (Optional[List[Any]]): Additional technical or contextual details.
+    """
+
+    status: str
+    timestamp: str
+    message: str
+    details: Optional[List[Any]]
\ No newline at end of file
@@ -1,4 +1,3 @@
-from typing import Generator
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
@@ -8,91 +7,70 @@ from app.domains.ia_group.service import IAGroupService
 from app.domains.agent.service import AgentService
 from app.domains.tool.service import ToolService
 from app.domains.user.service import UserService
-from app.core.sql_database import db
+from app.api.middleware import request_session
 
 # --- Database dependency ---
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> Session:
     """
-    Provide a SQLAlchemy database session.
+    Provide the SQLAlchemy session bound to the current request.
 
-    Yields:
-        Generator[Session, None, None]: Database session.
+    The session is opened and closed by `DBSessionMiddleware`, so every
+    dependency of a request shares it and no generator teardown has to run
+    after the response. Declared as ``async`` so FastAPI resolves it on the
+    event loop instead of dispatching a threadpool worker for a lookup.
+
+    Returns:
+        Session: Database session of the current request.
     """
-    session = db.get_session()
-    logger.debug('Database session created: %s', session)
-    try:
-        yield session
-    finally:
-        session.close()
-        logger.debug('Database session closed: %s', session)
+    return request_session.get()
 
 # --- Services dependencies ---
-def get_enterprise_service(db: Session = Depends(get_db)) -> Generator[EnterpriseService, None, None]:
+def get_enterprise_service(db: Session = Depends(get_db)) -> EnterpriseService:
     """
     Provide an EnterpriseService instance using the given DB session.
 
-    Yields:
+    Returns:
         EnterpriseService: Service instance.
     """
-    service = EnterpriseService(db)
-    logger.debug('EnterpriseService instance created with session: %s', db)
-    try:
-        yield service
-    finally:
-        logger.debug('EnterpriseService instance released: %s', service)
+    logger.debug('EnterpriseService instance created')
+    return EnterpriseService(db)
 
-def get_ia_group_service(db: Session = Depends(get_db)) -> Generator[IAGroupService, None, None]:
+def get_ia_group_service(db: Session = Depends(get_db)) -> IAGroupService:
     """
     Provide an IAGroupService instance using the given DB session.
 
-    Yields:
+    Returns:
         IAGroupService: Service instance.
     """
-    service = IAGroupService(db)
-    logger.debug('IAGroupService instance created with session: %s', db)
-    try:
-        yield service
-    finally:
-        logger.debug('IAGroupService instance released: %s', service)
+    logger.debug('IAGroupService instance created')
+    return IAGroupService(db)
 
-def get_agent_service(db: Session = Depends(get_db)) -> Generator[AgentService, None, None]:
+def get_agent_service(db: Session = Depends(get_db)) -> AgentService:
     """
     Provide an AgentService instance using the given DB session.
 
-    Yields:
+    Returns:
         AgentService: Service instance.
     """
-    service = AgentService(db)
-    logger.debug('AgentService instance created with session: %s', db)
-    try:
-        yield service
-    finally:
-        logger.debug('AgentService instance released: %s', service)
+    logger.debug('AgentService instance created')
+    return AgentService(db)
 
-def get_tool_service(db: Session = Depends(get_db)) -> Generator[ToolService, None, None]:
+def get_tool_service(db: Session = Depends(get_db)) -> ToolService:
     """
     Provide an ToolService instance using the given DB session.
 
-    Yields:
+    Returns:
         ToolService: Service instance.
     """
-    service = ToolService(db)
-    logger.debug('ToolService instance created with session: %s', db)
-    try:
-        yield service
-    finally:
-        logger.debug('ToolService instance released: %s', service)
+    logger.debug('ToolService instance created')
+    return ToolService(db)
 
-def get_user_service(db: Session = Depends(get_db)) -> Generator[UserService, None, None]:
+def get_user_service(db: Session = Depends(get_db)) -> UserService:
     """
     Provide an UserService instance using the given DB session.
 
-    Yields:
+    Returns:
         UserService: Service instance.
     """
-    service = UserService(db)
-    logger.debug('UserService instance created with session: %s', db)
-    try:
-        yield service
-    finally:
-        logger.debug('UserService instance released: %s', service)
\ No newline at end of file
+    logger.debug('UserService instance created')
+    return UserService(db)
\ No newline at end of file
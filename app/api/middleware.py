@@ -0,0 +1,88 @@
+import logging
+from contextvars import ContextVar
+
+from anyio import CancelScope, to_thread
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import logger
+from app.core.sql_database import db
+
+# --- Per-request database session ---
+request_session: ContextVar[Session] = ContextVar('request_session')
+
+# --- Methods whose successful responses commit the request transaction ---
+_WRITE_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
+
+
+class DBSessionMiddleware:
+    """
+    Pure ASGI middleware that owns the database session of each HTTP request.
+
+    The session is opened before the application is called and closed after
+    the last body chunk has been sent, so streaming responses can keep using
+    it. Dependencies read it from `request_session` instead of driving a
+    generator per request; sync endpoints see it too because the threadpool
+    runs them in a copy of the request context.
+
+    It is also the request's unit of work: repositories only flush, and for
+    write methods the transaction is committed once, right before a
+    successful (< 400) response starts, so the client never sees a success
+    for data that was not committed. Error responses and read-only methods
+    are rolled back when the session closes.
+
+    Commit and close do blocking database I/O (a round trip, an fsync on
+    SQLite), so they run on the threadpool instead of the event loop. The
+    session lifecycle mirrors `db.get_session()`: a connection that raised a
+    DBAPI error is invalidated before the session is closed.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap the given ASGI application.
+
+        Args:
+            app (ASGIApp): The downstream ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Bind a fresh session to the request context for HTTP scopes and
+        commit it when a write request succeeds.
+
+        Args:
+            scope (Scope): The ASGI connection scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        session = db.SessionLocal()
+        token = request_session.set(session)
+        downstream_send: Send = send
+
+        if scope['method'] in _WRITE_METHODS:
+            async def commit_on_success(message: Message) -> None:
+                if message['type'] == 'http.response.start' and message['status'] < 400:
+                    await to_thread.run_sync(session.commit)
+                await send(message)
+
+            downstream_send = commit_on_success
+
+        try:
+            await self.app(scope, receive, downstream_send)
+        except DBAPIError:
+            with CancelScope(shield=True):
+                await to_thread.run_sync(session.invalidate)
+            raise
+        finally:
+            request_session.reset(token)
+            # --- Always return the connection, even if the request was cancelled ---
+            with CancelScope(shield=True):
+                await to_thread.run_sync(session.close)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Database session closed: %s', session)
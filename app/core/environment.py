@@ -1,36 +1,45 @@
-import os
-
-from typing import Literal, cast
-from pydantic_settings import BaseSettings
+from typing import Literal
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class EnvironmentSettings(BaseSettings):
     """
     Application configuration settings loaded from environment variables or defaults.
 
+    Values are resolved once by BaseSettings (environment first, then `.env`)
+    and the instance is frozen, so they cannot drift after startup.
+
     Args:
         BaseSettings: Pydantic BaseSettings class that provides environment variable parsing and validation.
     """
+    model_config = SettingsConfigDict(frozen=True, env_file='.env', env_file_encoding='utf-8')
+
     # --- General ---
-    ENVIRONMENT: str = cast(Literal['production', 'development', 'approval', 'local'], os.getenv('ENVIRONMENT'))
-    DEBUG: bool = bool(os.getenv('DEBUG', False))
+    ENVIRONMENT: Literal['production', 'development', 'approval', 'local'] = 'local'
+    DEBUG: bool = False
 
     # --- Logging ---
-    LOG_LEVEL: str = cast(Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'], os.getenv('LOG_LEVEL'))
-    LOG_PATH: str = os.getenv('LOG_PATH', '')
+    LOG_LEVEL: str = 'INFO'
+    LOG_PATH: str = ''
+
+    # --- Server ---
+    THREADPOOL_SIZE: int = 100
 
     # --- Database ---
-    DB_DIR: str = os.getenv('DB_DIR', '')
-    DB_FILE: str = os.getenv('DB_FILE', '')
-    DB_ECHO: str = os.getenv('DB_ECHO', '')
+    DB_DIR: str = ''
+    DB_FILE: str = ''
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_USE_LIFO: bool = True
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_PREWARM: int = 5
 
     # --- JWT Auth ---
-    SECRET_KEY: str = os.getenv('', '')
-    ALGORITHM: str = os.getenv('', '')
-    ACCESS_TOKEN_EXPIRE_MINUTES : int = int(os.getenv('', ''))
-
-    class Config:
-        env_file = '.env'
-        env_file_encoding = 'utf-8'
+    SECRET_KEY: str = ''
+    ALGORITHM: str = 'HS256'
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
 # --- Singleton Instance ---
-settings = EnvironmentSettings()
\ No newline at end of file
+settings = EnvironmentSettings()
@@ -1,8 +1,13 @@
+import atexit
+import queue
 import sys
-from datetime import datetime, timezone
+import time
 import logging
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+from pydantic import BaseModel
 
 from app.core.environment import settings
 
@@ -18,6 +23,7 @@ class LoggerSettings:
     """
     _instance: Optional['LoggerSettings'] = None
     logger: logging.Logger
+    listener: QueueListener
 
     def __new__(cls):
         """
@@ -37,6 +43,9 @@ class LoggerSettings:
 
         Sets the log level and formatting based on settings. Ensures
         that multiple handlers are not added if already configured.
+        The console and file handlers are driven by a QueueListener thread,
+        so emitting a record on a request thread is only a queue put and
+        never waits on stdout or disk I/O.
         """
         self.logger = logging.getLogger(__name__)
 
@@ -50,25 +59,48 @@ class LoggerSettings:
 
         # --- Defines log format ---
         formatter = logging.Formatter(
-            fmt='%(asctime)s | %(levelname)s | %(name)s | %(message)s',
+            fmt='%(asctime)s | %(levelname)s | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+        formatter.converter = time.gmtime
 
         # --- Log handler configuration ---
-        if not self.logger.handlers:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
-        
-            # --- Configure log file ---
-            if settings.LOG_PATH:
-                log_dir = Path(settings.LOG_PATH).parent if settings.LOG_PATH.endswith('.log') else Path(settings.LOG_PATH)
-                log_dir.mkdir(parents=True, exist_ok=True)
-                daily_filename = datetime.now(timezone.utc).strftime('%Y%m%d') + '.log'
-                log_path = log_dir / daily_filename
-                file_handler = logging.FileHandler(log_path, encoding='utf-8')
-                file_handler.setFormatter(formatter)
-                self.logger.addHandler(file_handler)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        handlers: List[logging.Handler] = [console_handler]
+
+        # --- Configure log file ---
+        if settings.LOG_PATH:
+            log_dir = Path(settings.LOG_PATH).parent if settings.LOG_PATH.endswith('.log') else Path(settings.LOG_PATH)
+            log_dir.mkdir(parents=True, exist_ok=True)
+            file_handler = TimedRotatingFileHandler(
+                log_dir / 'app.log',
+                when='midnight',
+                utc=True,
+                backupCount=30,
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        # --- Non-blocking dispatch: request threads only enqueue records ---
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        self.logger.addHandler(queue_handler)
+        self.listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.listener.stop)
+
+        # --- SQL statement logging (replaces engine echo) ---
+        sql_logger = logging.getLogger('sqlalchemy.engine')
+        sql_logger.setLevel(logging.INFO if settings.DB_ECHO else logging.WARNING)
+        sql_logger.addHandler(queue_handler)
+
+        # --- Skip LogRecord fields the format never renders ---
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        logging._srcfile = None
 
     def get_logger(self) -> logging.Logger:
         """
@@ -79,5 +111,32 @@ class LoggerSettings:
         """
         return self.logger
 
+
+class LazyDump:
+    """
+    Defers serialization of a Pydantic model until a log record is rendered.
+
+    Pass it as a %-style logging argument: when the level is disabled the
+    record is never built, so the model is never dumped. When it is, the
+    model's compiled serializer writes JSON directly instead of building the
+    intermediate dict tree of `model_dump()`.
+    """
+    __slots__ = ('model',)
+
+    def __init__(self, model: BaseModel) -> None:
+        """
+        Args:
+            model (BaseModel): Model to dump when the record is formatted.
+        """
+        self.model = model
+
+    def __str__(self) -> str:
+        """
+        Returns:
+            str: The model serialized as JSON.
+        """
+        return self.model.__pydantic_serializer__.to_json(self.model).decode()
+
+
 # --- Singleton Instance ---
 logger: logging.Logger = LoggerSettings().get_logger()
\ No newline at end of file
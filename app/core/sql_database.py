@@ -1,78 +1,132 @@
 from __future__ import annotations
 
 import importlib
+import importlib.util
+from contextlib import contextmanager
 import pkgutil
-from threading import Lock
-from typing import Type
+from typing import Any, Dict, Iterator, List, Type
 from pathlib import Path
 
 from app.core.logger import logger
 from app.core.environment import settings
 
-from sqlalchemy import create_engine, Integer
+from sqlalchemy import Connection, create_engine, event, make_url, Integer
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker, Mapped, mapped_column
+from sqlalchemy.pool import StaticPool
 
 
 # --- Declarative basis for all models ---
 class Base(DeclarativeBase):
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
 
-# --- Singleton to manage the database ---
-class SQLDatabaseSettings:
-    """Singleton class for managing the database connection and sessions.
+# --- SQLite connection tuning ---
+_SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA foreign_keys=ON',
+)
 
-    This class ensures that only one instance of the database engine and session factory
-    exists throughout the application. It provides methods to create tables, get sessions,
-    and import models dynamically.
 
-    Returns:
-        SQLDatabaseSettings: A singleton instance of the database settings manager.
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Applies the SQLite PRAGMAs on every new DBAPI connection.
+
+    WAL lets readers proceed while a write is in progress, and with
+    synchronous=NORMAL a commit no longer waits on an fsync of the database
+    file (the WAL is synced at checkpoints), which remains safe against
+    application crashes. Foreign keys are off by default in SQLite; enabling
+    them enforces the REFERENCES and ON DELETE CASCADE clauses of the
+    association tables, as on server databases.
+
+    Args:
+        dbapi_connection (Any): The raw sqlite3 connection being opened.
+        connection_record (Any): The pool's record for the connection (unused).
     """
-    _instance: SQLDatabaseSettings | None = None
-    _lock = Lock()
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
-    def __new__(cls, db_url: str, echo: bool = True) -> SQLDatabaseSettings:
-        """Creates or returns the singleton instance of SQLDatabaseSettings.
 
-        Ensures that only one instance of the database settings manager exists
-        across the application. Thread-safe using a lock to prevent race conditions.
+# --- Model discovery ---
+def discover_model_modules(package: str) -> List[str]:
+    """Finds the `model` modules of a package's direct subpackages.
 
-        Args:
-            db_url (str): The database connection URL (e.g., SQLite, PostgreSQL).
-            echo (bool, optional): If True, SQLAlchemy will log all SQL statements. Defaults to True.
+    Used by `SQLDatabaseSettings.import_models` when the package has no
+    `_models_manifest`, and by the tests to check that the manifest still
+    lists every model module.
 
-        Returns:
-            SQLDatabaseSettings: The singleton instance of the database settings manager.
-        """
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    logger.debug('Creating SQLDatabaseSettings singleton instance with DB URL: %s', db_url)
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        else:
-            logger.debug('Returning existing SQLDatabaseSettings singleton instance')
-        return cls._instance
+    Args:
+        package (str): The Python package path (e.g., 'app.domains').
+
+    Returns:
+        List[str]: Dotted module names, in the order the subpackages are found.
+    """
+    pkg = importlib.import_module(package)
+    candidates = (
+        f'{pkg.__name__}.{name}.model'
+        for _, name, is_pkg in pkgutil.iter_modules(pkg.__path__)
+        if is_pkg
+    )
+    return [name for name in candidates if importlib.util.find_spec(name) is not None]
+
+
+# --- Database manager ---
+class SQLDatabaseSettings:
+    """Manages the database connection and sessions.
+
+    Holds the SQLAlchemy engine and session factory and provides methods to
+    create tables, get sessions, and import models dynamically. The application
+    uses the single module-level `db` instance; module import already runs
+    exactly once, so no locking or re-entry guard is needed.
+    """
+    def __init__(self, db_url: str, echo: bool = False) -> None:
+        """Initializes the SQLDatabaseSettings instance.
 
-    def __init__(self, db_url: str, echo: bool = True) -> None:
-        """Initializes the SQLDatabaseSettings singleton instance.
+        Sets up the SQLAlchemy engine and session factory.
 
-        Sets up the SQLAlchemy engine and session factory. This method only runs
-        once for the singleton instance; subsequent calls will be ignored.
+        Pooled connections are sized from the DB_POOL_* settings and, by
+        default, checked out LIFO so bursts reuse the most recently used
+        (warm) connections and idle ones can age out. In-memory
+        SQLite only exists inside one connection, so it uses a StaticPool shared
+        across threads instead; recycling and pre-ping only apply to server
+        databases, where connections can be dropped by the other side.
 
         Args:
             db_url (str): The database connection URL (e.g., SQLite, PostgreSQL).
-            echo (bool, optional): If True, SQLAlchemy will log all SQL statements. Defaults to True.
+            echo (bool, optional): If True, SQLAlchemy will log all SQL statements. Defaults to False;
+                prefer the DB_ECHO setting, which routes statements through the app log handlers.
         """
-        if getattr(self, '_initialized', False):
-            logger.debug('SQLDatabaseSettings already initialized; skipping __init__')
-            return
-
         logger.debug('Initializing SQLDatabaseSettings with DB URL: %s', db_url)
-        self.engine = create_engine(db_url, echo=echo)
-        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
-        self._initialized = True
+        url = make_url(db_url)
+        is_sqlite = url.get_backend_name() == 'sqlite'
+        engine_options: Dict[str, Any] = {'echo': echo}
+
+        if is_sqlite and url.database in (None, '', ':memory:'):
+            engine_options.update(poolclass=StaticPool, connect_args={'check_same_thread': False})
+        else:
+            engine_options.update(
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_use_lifo=settings.DB_POOL_USE_LIFO
+            )
+            if not is_sqlite:
+                engine_options.update(
+                    pool_recycle=settings.DB_POOL_RECYCLE,
+                    pool_pre_ping=settings.DB_POOL_PRE_PING
+                )
+
+        self.engine = create_engine(db_url, **engine_options)
+        if is_sqlite:
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
+        self.SessionLocal = sessionmaker(bind=self.engine, autocommit=False)
         logger.info('Database engine and session factory created successfully')
 
     def create_tables(self, base: Type[DeclarativeBase]) -> None:
@@ -90,48 +144,83 @@ class SQLDatabaseSettings:
         base.metadata.create_all(self.engine)
         logger.info('All tables created successfully for base: %s', base.__name__)
 
-    def get_session(self) -> Session:
-        """Creates and returns a new SQLAlchemy session.
+    @contextmanager
+    def get_session(self) -> Iterator[Session]:
+        """Provides a new SQLAlchemy session and guarantees its release.
 
         This session can be used to interact with the database, including
-        querying, inserting, updating, and deleting records. The session
-        should be closed manually after use to release resources.
+        querying, inserting, updating, and deleting records. On exit the
+        session is closed, returning its connection to the pool; if a DBAPI
+        error escapes, the connection is invalidated first so a broken
+        connection is never handed to the next request.
 
-        Returns:
-            Session: A new SQLAlchemy session bound to the engine.
+        Yields:
+            Iterator[Session]: A new SQLAlchemy session bound to the engine.
         """
         logger.debug('Creating a new database session')
         session = self.SessionLocal()
-        logger.debug('New database session created: %s', session)
-        return session
+        try:
+            yield session
+        except DBAPIError:
+            session.invalidate()
+            raise
+        finally:
+            session.close()
+
+    def prewarm(self, count: int) -> int:
+        """Opens up to `count` pooled connections ahead of the first requests.
+
+        The connections are checked out together, so each one is a new DBAPI
+        connection (and runs the SQLite PRAGMAs), then all are returned to the
+        pool, which keeps them for reuse. The count is capped at the pool size,
+        since connections beyond it would be discarded on return.
+
+        Args:
+            count (int): Number of connections to open.
+
+        Returns:
+            int: Number of connections actually opened.
+        """
+        count = min(count, self.engine.pool.size())
+        connections: List[Connection] = []
+        try:
+            for _ in range(count):
+                connections.append(self.engine.connect())
+        finally:
+            for connection in connections:
+                connection.close()
+        logger.debug('Prewarmed %d pooled connections', len(connections))
+        return len(connections)
 
     def import_models(self, package: str) -> None:
         """Dynamically imports all 'model' modules within a given package.
 
         This ensures that all SQLAlchemy models are registered with the
-        declarative base before creating tables. It recursively scans
-        the package for modules ending with 'model' and imports them.
+        declarative base before creating tables. The module names come from
+        the package's `_models_manifest.MODELS`; only when the package has no
+        manifest are its direct subpackages checked for a `model` module.
 
         Args:
             package (str): The Python package path (e.g., 'app.domains')
                         where model modules should be imported from.
         """
         logger.debug('Importing model modules from package: %s', package)
-        pkg = importlib.import_module(package)
-        
-        for _, module_name, is_pkg in pkgutil.walk_packages(pkg.__path__, pkg.__name__ + '.'):
-            
-            if not is_pkg and module_name.endswith('model'):
-                importlib.import_module(module_name)
-                logger.debug('Imported model module: %s', module_name)
-        
+        try:
+            module_names = importlib.import_module(f'{package}._models_manifest').MODELS
+        except ModuleNotFoundError:
+            module_names = discover_model_modules(package)
+
+        for module_name in module_names:
+            importlib.import_module(module_name)
+            logger.debug('Imported model module: %s', module_name)
+
         logger.info('All model modules imported successfully from package: %s', package)
 
 
 # --- Database configuration ---
 Path(settings.DB_DIR).mkdir(parents=True, exist_ok=True)
 
-# --- Create singleton and initialize DB ---
-db = SQLDatabaseSettings(f'sqlite:///{settings.DB_DIR}/{settings.DB_FILE}', echo=bool(settings.DB_ECHO))
+# --- Create the shared instance and initialize DB ---
+db = SQLDatabaseSettings(f'sqlite:///{settings.DB_DIR}/{settings.DB_FILE}')
 db.import_models('app.domains')
 db.create_tables(Base)
\ No newline at end of file
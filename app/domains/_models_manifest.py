@@ -0,0 +1,11 @@
+# --- Model modules registered with the declarative base ---
+# Read by SQLDatabaseSettings.import_models instead of walking the package
+# on every start. Keep in sync when a domain adds or removes a model module;
+# tests/test_models_manifest.py fails when it drifts.
+MODELS = (
+    'app.domains.agent.model',
+    'app.domains.enterprise.model',
+    'app.domains.ia_group.model',
+    'app.domains.tool.model',
+    'app.domains.user.model',
+)
@@ -1,9 +1,8 @@
-from typing import List, cast
+from typing import List
 
-from app.core.logger import logger
 from app.domains.agent.service import AgentService
 from app.api.dependencies import get_agent_service
-from app.api.api_schemas import ResponseSchema
+from app.api.api_schemas import ResponseSchema, success_response
 from app.domains.agent.schema import (
     AgentCreateSchema, 
     AgentUpdateSchema,
@@ -11,6 +10,7 @@ from app.domains.agent.schema import (
 )
 
 from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 agent_router = APIRouter(
     prefix='/agent',
@@ -39,10 +39,32 @@ def create_agent(
     Returns:
         ResponseSchema[AgentResponseSchema]: Created Agent wrapped in a response schema.
     """
-    logger.info('Creating a new Agent with data: %s', schema.model_dump())
     agent = service.create(schema)
-    logger.info('Agent created successfully with ID: %s', agent.id)
-    return cast(ResponseSchema[AgentResponseSchema], ResponseSchema(data=agent))
+    return ResponseSchema[AgentResponseSchema].model_construct(data=agent)
+
+@agent_router.post(
+    '/bulk',
+    response_model=ResponseSchema[List[AgentResponseSchema]],
+    status_code=status.HTTP_201_CREATED,
+    summary='Create several Agents at once',
+    response_description='New Agents created.'
+)
+def create_agents_bulk(
+    schemas: List[AgentCreateSchema],
+    service: AgentService = Depends(get_agent_service)
+) -> ResponseSchema[List[AgentResponseSchema]]:
+    """
+    Create several Agents in a single database round trip and commit.
+
+    Args:
+        schemas (List[AgentCreateSchema]): Data for the new Agents.
+        service (AgentService, optional): Service instance. Defaults to Depends(get_agent_service).
+
+    Returns:
+        ResponseSchema[List[AgentResponseSchema]]: Created Agents wrapped in a response schema.
+    """
+    agents = service.create_many(schemas)
+    return ResponseSchema[List[AgentResponseSchema]].model_construct(data=agents)
 
 @agent_router.get(
     '/',
@@ -53,7 +75,7 @@ def create_agent(
 )
 def list_all_agents(
     service: AgentService = Depends(get_agent_service)
-) -> ResponseSchema[List[AgentResponseSchema]]:
+) -> ORJSONResponse:
     """
     Retrieve a list of all registered Agents.
 
@@ -61,12 +83,33 @@ def list_all_agents(
         service (AgentService, optional): Service instance. Defaults to Depends(get_agent_service).
 
     Returns:
-        ResponseSchema[List[AgentResponseSchema]]: List of Agents wrapped in a response schema.
+        ORJSONResponse: List of Agents wrapped in the success envelope.
+    """
+    return success_response(service.list_all())
+
+@agent_router.get(
+    '/stream',
+    response_class=StreamingResponse,
+    summary='Stream all Agents as NDJSON',
+    response_description='One JSON document per active Agent, newline-delimited.'
+)
+def stream_all_agents(
+    service: AgentService = Depends(get_agent_service)
+) -> StreamingResponse:
+    """
+    Stream every active Agent as newline-delimited JSON.
+
+    Rows are read from the database in batches and written as they arrive,
+    so memory does not grow with the number of Agents. Declared before
+    `/{agent_id}` so the path is not parsed as an ID.
+
+    Args:
+        service (AgentService, optional): Service instance. Defaults to Depends(get_agent_service).
+
+    Returns:
+        StreamingResponse: NDJSON stream of AgentResponseSchema documents.
     """
-    logger.info('Retrieving all Agents from the database')
-    agents = service.list_all()
-    logger.info('Retrieved %d Agents', len(agents))
-    return cast(ResponseSchema[List[AgentResponseSchema]], ResponseSchema(data=agents))
+    return StreamingResponse(service.stream_all(), media_type='application/x-ndjson')
 
 @agent_router.get(
     '/{agent_id}',
@@ -88,10 +131,8 @@ def list_by_id(
     Returns:
         ResponseSchema[AgentResponseSchema]: The Agent data wrapped in a response schema.
     """
-    logger.info('Retrieving Agent with ID: %d', agent_id)
     agent = service.list_by_id(agent_id)
-    logger.info('Agent retrieved successfully: %s', agent.model_dump())
-    return cast(ResponseSchema[AgentResponseSchema], ResponseSchema(data=agent))
+    return ResponseSchema[AgentResponseSchema].model_construct(data=agent)
 
 @agent_router.put(
     '/{agent_id}',
@@ -115,10 +156,9 @@ def update_by_id(
     Returns:
         ResponseSchema[AgentResponseSchema]: The updated Agent data wrapped in a response schema.
     """
-    logger.info('Updating Agent with ID: %d using data: %s', agent_id, schema.model_dump())
-    updated_agent = service.update(agent_id, schema)
-    logger.info('Agent updated successfully: %s', updated_agent.model_dump())
-    return ResponseSchema(data=AgentResponseSchema.model_validate(updated_agent))
+    data = schema.model_dump(exclude_unset=True)
+    updated_agent = service.update(agent_id, data)
+    return ResponseSchema[AgentResponseSchema].model_construct(data=updated_agent)
 
 @agent_router.delete(
     '/{agent_id}',
@@ -144,9 +184,7 @@ def logical_delete_by_id(
     Returns:
         Response: HTTP 204 No Content response indicating successful logical deletion.
     """
-    logger.info('Initiating logical deletion for Agent with ID: %d', agent_id)
     service.logical_delete(agent_id)
-    logger.info('Agent with ID %d marked as inactive successfully', agent_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 # --- Relationship Routes ---
@@ -171,9 +209,7 @@ def link_tool_to_agent(
     Returns:
         Response: HTTP 204 No Content response indicating successful linking.
     """
-    logger.info('Linking Tool %d to Agent %d', tool_id, agent_id)
     service.link_tool(agent_id, tool_id)
-    logger.info('Tool %d successfully linked to Agent %d', tool_id, agent_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @agent_router.delete(
@@ -197,9 +233,7 @@ def unlink_tool_from_agent(
     Returns:
         Response: HTTP 204 No Content response indicating successful unlinking.
     """
-    logger.info('Unlinking Tool %d from Agent %d', tool_id, agent_id)
     service.unlink_tool(agent_id, tool_id)
-    logger.info('Tool %d successfully unlinked from Agent %d', tool_id, agent_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @agent_router.get(
@@ -222,7 +256,5 @@ def list_tools_of_agent(
     Returns:
         ResponseSchema[List[int]]: List of Tool IDs linked to the Agent.
     """
-    logger.info('Retrieving Tools linked to Agent %d', agent_id)
     tool_ids = service.list_tools(agent_id)
-    logger.info('Agent %d has %d linked Tools', agent_id, len(tool_ids))
-    return ResponseSchema(data=tool_ids)
\ No newline at end of file
+    return ResponseSchema[List[int]].model_construct(data=tool_ids)
\ No newline at end of file
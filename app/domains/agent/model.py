@@ -4,7 +4,7 @@ from app.core.sql_database import Base
 from app.domains.associations.agent_tool_association import agent_tool_association
 from app.domains.associations.ia_group_agent_association import ia_group_agent_association
 
-from sqlalchemy import String, Boolean
+from sqlalchemy import Index, String, Boolean, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class Agent(TimestampMixin, AuditMixin, Base):
@@ -20,9 +20,22 @@ class Agent(TimestampMixin, AuditMixin, Base):
             Agent X Enterprise
     """
     __tablename__ = 'agent'
+    __table_args__ = (
+        # --- Partial index over active rows only (logical deletes stay out of it) ---
+        Index(
+            'ix_agent_active',
+            'id',
+            sqlite_where=text('status = 1'),
+            postgresql_where=text('status = true')
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True, nullable=False)
-    name: Mapped[str] = mapped_column(String(30), nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # --- Byte-wise 'C' collation on PostgreSQL; SQLite's default BINARY collation already compares bytes ---
+    name: Mapped[str] = mapped_column(
+        String(30).with_variant(String(30, collation='C'), 'postgresql'),
+        nullable=False
+    )
     description: Mapped[str] = mapped_column(String(255), nullable=False)
     system_message: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Annotated, Optional
 from pydantic import BaseModel, Field
 
+from app.api.api_schemas import ORMConstructMixin
+
 # --- Input Schema ---
 # --- Input Schema ---
 class AgentCreateSchema(BaseModel):
@@ -19,7 +21,7 @@ class AgentUpdateSchema(BaseModel):
     updated_by: Annotated[str, Field(min_length=3, max_length=50, description='User or system that updated the agent')] = "system"
 
 # --- Output Schema ---
-class AgentResponseSchema(BaseModel):
+class AgentResponseSchema(ORMConstructMixin, BaseModel):
     """Schema representing an Agent for API responses."""
     id: int
     name: str
@@ -1,18 +1,29 @@
-from typing import List
+from typing import Any, Dict, Iterator, List
 from sqlalchemy.orm import Session
 
-from app.core.logger import logger
+from app.core.logger import LazyDump, logger
 from app.repositories.base import BaseRepository
 from app.repositories.many_to_many import ManyToManyRepository
 from app.domains.agent.model import Agent
 from app.domains.tool.model import Tool, agent_tool_association
 from app.domains.agent.schema import (
     AgentCreateSchema, 
-    AgentUpdateSchema, 
     AgentResponseSchema
 )
 
 from app.api.exceptions import NotFoundException
+from app.utils.cache import TTLCache, invalidate_on_commit
+
+# --- Repository type parameterized once at import ---
+_AgentRepository = BaseRepository[Agent, AgentCreateSchema]
+
+# --- Short-lived read-through cache for list_by_id (collapses burst reads) ---
+# Per process: writes only invalidate the worker that handled them, so other
+# workers may serve an updated or deleted Agent for up to the 2 s TTL.
+_agent_cache: TTLCache[int, AgentResponseSchema] = TTLCache(maxsize=1024, ttl=2.0)
+
+# --- Columns selected for the list; exactly the response fields ---
+_LIST_COLUMNS = tuple(AgentResponseSchema.model_fields)
 
 class AgentService:
     """
@@ -28,7 +39,7 @@ class AgentService:
             session (Session): SQLAlchemy session for database operations.
         """
         self._session = session
-        self._repository = BaseRepository[Agent, AgentCreateSchema](Agent, self._session)
+        self._repository = _AgentRepository(Agent, self._session)
         self._many_to_many = ManyToManyRepository(self._session, agent_tool_association)
 
     def create(self, schema: AgentCreateSchema) -> AgentResponseSchema:
@@ -41,53 +52,99 @@ class AgentService:
         Returns:
             AgentResponseSchema: The created Agent as a response schema.
         """
-        logger.info('Creating a new Agent with data: %s', schema.model_dump())
         agent = self._repository.create(schema)
-        validated_agents = AgentResponseSchema.model_validate(agent)
-        logger.info('Agent created successfully: %s', validated_agents.model_dump())
+        validated_agents = AgentResponseSchema.from_orm_fast(agent)
+        logger.info('Agent created successfully: %s', LazyDump(validated_agents))
         return validated_agents
 
-    def list_all(self) -> List[AgentResponseSchema]:
+    def create_many(self, schemas: List[AgentCreateSchema]) -> List[AgentResponseSchema]:
         """
-        Retrieve all Agents from the database.
+        Create several Agents in one INSERT and one commit.
+
+        Args:
+            schemas (List[AgentCreateSchema]): Data for the new Agents.
 
         Returns:
-            List[AgentResponseSchema]: List of Agents as response schemas.
+            List[AgentResponseSchema]: The created Agents as response schemas.
         """
-        logger.info('Retrieving all Agents from the database')
-        agents = self._repository.get_all()
-        validated_agents = [AgentResponseSchema.model_validate(agt) for agt in agents]
-        logger.info('Retrieved %d Agents', len(validated_agents))
+        rows = self._repository.create_many(schemas)
+        validated_agents = [AgentResponseSchema.from_orm_fast(row) for row in rows]
+        logger.info('Created %d Agents in bulk', len(validated_agents))
         return validated_agents
 
+    def list_all(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve all Agents as plain dicts of the response columns.
+
+        For read-only endpoints that serialize the list straight away: the
+        rows skip schema validation and are handed to orjson as they are.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per Agent, keyed by response field.
+        """
+        agents = [row._asdict() for row in self._repository.get_all_rows(_LIST_COLUMNS)]
+        logger.info('Retrieved %d Agents', len(agents))
+        return agents
+
+    def stream_all(self) -> Iterator[bytes]:
+        """
+        Stream all active Agents as NDJSON, one chunk per database batch.
+
+        The number of Agents is tallied per batch while streaming and logged
+        once the stream is exhausted, so nothing is materialized to count it.
+
+        Yields:
+            Iterator[bytes]: Newline-terminated JSON documents, one per Agent.
+        """
+        streamed = 0
+        for agents in self._repository.iter_all():
+            streamed += len(agents)
+            yield b''.join(
+                AgentResponseSchema.from_orm_fast(agt).model_dump_json().encode() + b'\n'
+                for agt in agents
+            )
+        logger.info('Streamed %d Agents', streamed)
+
     def list_by_id(self, id: int) -> AgentResponseSchema:
         """
         Retrieve an Agent by its ID.
 
+        Results are kept for a couple of seconds in an in-process cache, so a
+        burst of reads for the same Agent costs one query. Writes through this
+        service drop the entry.
+
         Args:
             id (int): Unique identifier of the Agent.
 
         Returns:
             AgentResponseSchema: The Agent data.
         """
-        logger.info('Retrieving Agent with ID: %d', id)
+        cached_agent = _agent_cache.get(id)
+        if cached_agent is not None:
+            logger.debug('Agent with ID %d served from cache', id)
+            return cached_agent
+
         agent = self._repository.get_by_id(id)
         
         if not agent:
-            logger.warning('Agent with ID %d not found', id)
             raise NotFoundException('Agent', id)
         
-        validated_agent = AgentResponseSchema.model_validate(agent)
-        logger.info('Agent retrieved successfully: %s', validated_agent.model_dump())
+        validated_agent = AgentResponseSchema.from_orm_fast(agent)
+        _agent_cache.set(id, validated_agent)
+        logger.info('Agent retrieved successfully: %s', LazyDump(validated_agent))
         return validated_agent
     
-    def update(self, id: int, schema: AgentUpdateSchema) -> AgentResponseSchema:
+    def update(self, id: int, data: Dict[str, Any]) -> AgentResponseSchema:
         """
         Update an existing Agent by its ID.
 
+        The change and the lookup are a single UPDATE ... RETURNING; only a
+        request with nothing to change falls back to a plain read.
+
         Args:
             id (int): The ID of the Agent to update.
-            schema (AgentUpdateSchema): The data to update the Agent with.
+            data (Dict[str, Any]): Fields explicitly set on the AgentUpdateSchema
+                (`model_dump(exclude_unset=True)`); empty means nothing to update.
 
         Raises:
             NotFoundException: If the Agent with the given ID does not exist.
@@ -95,16 +152,14 @@ class AgentService:
         Returns:
             AgentResponseSchema: The updated Agent data.
         """
-        logger.info('Updating Agent with ID: %d using data: %s', id, schema.model_dump())
-        agent = self._repository.get_by_id(id)
+        updated_agent = self._repository.update_by_id(id, data) if data else self._repository.get_by_id(id)
         
-        if not agent:
-            logger.warning('Agent with ID %d not found for update', id)
+        if not updated_agent:
             raise NotFoundException("Agent", id)
 
-        updated_agent = self._repository.update(agent, schema)
-        validated_agent = AgentResponseSchema.model_validate(updated_agent)
-        logger.info('Agent updated successfully: %s', validated_agent.model_dump())
+        invalidate_on_commit(self._session, _agent_cache, id)
+        validated_agent = AgentResponseSchema.from_orm_fast(updated_agent)
+        logger.info('Agent updated successfully: %s', LazyDump(validated_agent))
         return validated_agent
     
     def delete(self, id: int) -> None:
@@ -117,14 +172,10 @@ class AgentService:
         Raises:
             NotFoundException: If no Agent with the given ID exists.
         """
-        logger.info('Deleting Agent with ID: %d', id)
-        agent = self._repository.get_by_id(id)
-        
-        if not agent:
-            logger.warning('Agent with ID %d not found for deletion', id)
+        if not self._repository.delete_by_id(id):
             raise NotFoundException("Agent", id)
 
-        self._repository.delete(agent)
+        invalidate_on_commit(self._session, _agent_cache, id)
         logger.info('Agent with ID %d deleted successfully', id)
   
     def logical_delete(self, id: int) -> None:
@@ -141,14 +192,10 @@ class AgentService:
         Raises:
             NotFoundException: If no Agent with the given ID exists.
         """
-        logger.info('Starting logical deletion for Agent with ID: %d', id)
-        agent = self._repository.get_by_id(id)
-        
-        if not agent:
-            logger.warning('Agent with ID %d not found for logical deletion', id)
+        if not self._repository.logical_delete_by_id(id):
             raise NotFoundException("Agent", id)
         
-        self._repository.logical_delete(agent)
+        invalidate_on_commit(self._session, _agent_cache, id)
         logger.info('Logical deletion completed: Agent with ID %d is now inactive', id)
 
     def link_tool(self, agent_id: int, tool_id: int) -> None:
@@ -162,15 +209,12 @@ class AgentService:
         Raises:
             NotFoundException: If Agent or Tool does not exist.
         """
-        logger.info('Linking Tool %d to Agent %d', tool_id, agent_id)
         agent = self._repository.get_by_id(agent_id)
         if not agent:
-            logger.warning('Agent with ID %d not found for linking', agent_id)
             raise NotFoundException('Agent', agent_id)
 
         tool = self._session.get(Tool, tool_id)
         if not tool:
-            logger.warning('Tool with ID %d not found for linking', tool_id)
             raise NotFoundException('Tool', tool_id)
 
         self._many_to_many.link(agent_id, tool_id, left_key='agent_id', right_key='tool_id')
@@ -184,7 +228,6 @@ class AgentService:
             agent_id (int): The Agent ID.
             tool_id (int): The Tool ID.
         """
-        logger.info('Unlinking Tool %d from Agent %d', tool_id, agent_id)
         self._many_to_many.unlink(agent_id, tool_id, left_key='agent_id', right_key='tool_id')
         logger.info('Tool %d successfully unlinked from Agent %d', tool_id, agent_id)
 
@@ -198,7 +241,6 @@ class AgentService:
         Returns:
             List[int]: IDs of Tools linked to the Agent.
         """
-        logger.info('Retrieving linked Tools for Agent %d', agent_id)
         tool_ids = self._many_to_many.get_links(agent_id, left_key='agent_id', right_key='tool_id')
         logger.info('Agent %d has %d linked Tools', agent_id, len(tool_ids))
-        return tool_ids
\ No newline at end of file
+        return tool_ids
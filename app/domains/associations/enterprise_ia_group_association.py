@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Index, Integer, ForeignKey
 from app.core.sql_database import Base
 
 # --- Table related to Enterprise X IA Group ---
@@ -6,5 +6,6 @@ enterprise_ia_group_association = Table(
     'enterprise_ia_group',
     Base.metadata,
     Column('enterprise_id', Integer, ForeignKey('enterprise.id', ondelete='CASCADE'), primary_key=True),
-    Column('ia_group_id', Integer, ForeignKey('ia_group.id', ondelete='CASCADE'), primary_key=True)
-)
\ No newline at end of file
+    Column('ia_group_id', Integer, ForeignKey('ia_group.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_enterprise_ia_group_ia_group', 'ia_group_id', 'enterprise_id')
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Index, Integer, ForeignKey
 from app.core.sql_database import Base
 
 # --- Table related to IA Group X Agent ---
@@ -6,5 +6,6 @@ ia_group_agent_association = Table(
     'ia_group_agent',
     Base.metadata,
     Column('ia_group_id', Integer, ForeignKey('ia_group.id', ondelete='CASCADE'), primary_key=True),
-    Column('agent_id', Integer, ForeignKey('agent.id', ondelete='CASCADE'), primary_key=True)
-)
\ No newline at end of file
+    Column('agent_id', Integer, ForeignKey('agent.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_ia_group_agent_agent', 'agent_id', 'ia_group_id')
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Index, Integer, ForeignKey
 from app.core.sql_database import Base
 
 # --- Table related to Enterprise X User ---
@@ -6,5 +6,6 @@ user_enterprise_association = Table(
     'user_enterprise',
     Base.metadata,
     Column('enterprise_id', Integer, ForeignKey('enterprise.id', ondelete='CASCADE'), primary_key=True),
-    Column('user_id', Integer, ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
-)
\ No newline at end of file
+    Column('user_id', Integer, ForeignKey('user.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_user_enterprise_user', 'user_id', 'enterprise_id')
+)
@@ -1,25 +1,36 @@
-from typing import List, cast
+from typing import Any, Dict, List, Optional
 
 from app.core.logger import logger
 from app.domains.enterprise.service import EnterpriseService
 from app.api.dependencies import get_enterprise_service
-from app.api.api_schemas import ResponseSchema
+from app.api.api_schemas import ResponseSchema, success_response
+from app.utils.cache import TTLCache
+from app.utils.etag import etag_matches
 from app.domains.enterprise.schema import (
     EnterpriseCreateSchema, 
     EnterpriseUpdateSchema, 
     EnterpriseResponseSchema
 )
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Header, Response, status
+from fastapi.responses import ORJSONResponse
 
 enterprise_router = APIRouter(
     prefix='/enterprise',
     tags=['Enterprise']
 )
 
+# --- Response envelopes parameterized once at import ---
+_EnterpriseResponse = ResponseSchema[EnterpriseResponseSchema]
+_EnterpriseListResponse = ResponseSchema[List[EnterpriseResponseSchema]]
+_IdListResponse = ResponseSchema[List[int]]
+
+# --- List rows keyed by the list ETag; a new version means a new key ---
+_list_rows_cache: TTLCache[str, List[Dict[str, Any]]] = TTLCache(maxsize=8, ttl=60.0)
+
 @enterprise_router.post(
     '/',
-    response_model=ResponseSchema[EnterpriseResponseSchema],
+    response_model=_EnterpriseResponse,
     status_code=status.HTTP_201_CREATED,
     summary='Create a new Enterprise',
     response_description='New Enterprise created.'
@@ -27,7 +38,7 @@ enterprise_router = APIRouter(
 def create_enterprise(
     schema: EnterpriseCreateSchema,
     service: EnterpriseService = Depends(get_enterprise_service)
-) -> ResponseSchema[EnterpriseResponseSchema]:
+) -> ORJSONResponse:
     """
     Create a new enterprise using the provided schema.
 
@@ -36,65 +47,94 @@ def create_enterprise(
         service (EnterpriseService, optional): Service instance. Defaults to Depends(get_enterprise_service).
 
     Returns:
-        ResponseSchema[EnterpriseResponseSchema]: Created enterprise wrapped in a response schema.
+        ORJSONResponse: Created enterprise wrapped in the success envelope.
     """
-    logger.info('Creating a new enterprise with data: %s', schema.model_dump())
+    logger.info('Creating a new enterprise: %s', schema.name)
     created_enterprise = service.create(schema)
     logger.info('Enterprise created successfully with ID: %s', created_enterprise.id)
-    return cast(ResponseSchema[EnterpriseResponseSchema], ResponseSchema(data=created_enterprise))
+    return success_response(created_enterprise.model_dump(mode='json'), status_code=status.HTTP_201_CREATED)
 
 @enterprise_router.get(
     '/',
-    response_model=ResponseSchema[List[EnterpriseResponseSchema]],
+    response_model=_EnterpriseListResponse,
     status_code=status.HTTP_200_OK,
     summary='List all Enterprises',
     response_description='List of all registered enterprises.'
 )
 def list_all_enterprises(
+    if_none_match: Optional[str] = Header(None),
     service: EnterpriseService = Depends(get_enterprise_service)
-) -> ResponseSchema[List[EnterpriseResponseSchema]]:
+) -> Response:
     """
     Retrieve a list of all registered enterprises.
 
+    Answers `304 Not Modified` without loading the list when the client's
+    `If-None-Match` still matches the list's ETag. Otherwise the rows of the
+    current version are served from a short-lived cache, so only the first
+    request per version loads them; the envelope, with its timestamp, is
+    built for every response.
+
     Args:
+        if_none_match (Optional[str], optional): ETag(s) of the client's cached list.
         service (EnterpriseService, optional): Service instance. Defaults to Depends(get_enterprise_service).
 
     Returns:
-        ResponseSchema[List[EnterpriseResponseSchema]]: List of enterprises wrapped in a response schema.
+        Response: List of enterprises wrapped in the success envelope, or an empty 304.
     """
-    logger.info('Retrieving all enterprises from the database')
-    enterprises = service.list_all()
-    logger.info('Retrieved %d enterprises', len(enterprises))
-    return cast(ResponseSchema[List[EnterpriseResponseSchema]], ResponseSchema(data=enterprises))
+    etag = service.get_list_etag()
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+    enterprises = _list_rows_cache.get(etag)
+    if enterprises is None:
+        enterprises = service.list_all()
+        _list_rows_cache.set(etag, enterprises)
+
+    response = success_response(enterprises)
+    response.headers['ETag'] = etag
+    return response
 
 @enterprise_router.get(
     '/{enterprise_id}',
-    response_model=ResponseSchema[EnterpriseResponseSchema],
+    response_model=_EnterpriseResponse,
     summary='Query enterprise by ID',
     response_description='List the specified enterprise.'
 )
 def list_by_id(
     enterprise_id: int,
+    if_none_match: Optional[str] = Header(None),
     service: EnterpriseService = Depends(get_enterprise_service)
-) -> ResponseSchema[EnterpriseResponseSchema]:
+) -> Response:
     """
     Retrieve an enterprise by its ID.
 
+    The ETag is derived from the row's last change with a single-column query;
+    when it matches `If-None-Match` the enterprise is neither loaded nor
+    serialized and `304 Not Modified` is returned.
+
     Args:
         id (int): Unique identifier of the enterprise.
+        if_none_match (Optional[str], optional): ETag(s) of the client's cached enterprise.
         service (EnterpriseService, optional): Service handling enterprise operations. Defaults to Depends(get_enterprise_service).
 
     Returns:
-        ResponseSchema[EnterpriseResponseSchema]: The enterprise data wrapped in a response schema.
+        Response: The enterprise data wrapped in the success envelope, or an empty 304.
     """
+    etag = service.get_etag(enterprise_id)
+    if etag is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
     logger.info('Retrieving enterprise with ID: %d', enterprise_id)
     enterprise = service.list_by_id(enterprise_id)
-    logger.info('Enterprise retrieved successfully: %s', enterprise.model_dump())
-    return cast(ResponseSchema[EnterpriseResponseSchema], ResponseSchema(data=enterprise))
+    logger.info('Enterprise with ID %d retrieved successfully', enterprise_id)
+    response = success_response(enterprise.model_dump(mode='json'))
+    if etag is not None:
+        response.headers['ETag'] = etag
+    return response
 
 @enterprise_router.put(
     '/{enterprise_id}',
-    response_model=ResponseSchema[EnterpriseResponseSchema],
+    response_model=_EnterpriseResponse,
     summary='Update enterprise by ID',
     response_description='Update a specific enterprise.'
 )
@@ -102,7 +142,7 @@ def update_by_id(
     enterprise_id: int,
     schema: EnterpriseUpdateSchema,
     service: EnterpriseService = Depends(get_enterprise_service)
-) -> ResponseSchema[EnterpriseResponseSchema]:
+) -> ORJSONResponse:
     """
     Update an existing enterprise by its ID.
 
@@ -112,12 +152,13 @@ def update_by_id(
         service (EnterpriseService, optional): Service handling enterprise operations. Defaults to Depends(get_enterprise_service).
 
     Returns:
-        ResponseSchema[EnterpriseResponseSchema]: The updated enterprise data wrapped in a response schema.
+        ORJSONResponse: The updated enterprise data wrapped in the success envelope.
     """
-    logger.info('Updating enterprise with ID: %d using data: %s', enterprise_id, schema.model_dump())
-    updated_enterprise = service.update(enterprise_id, schema)
-    logger.info('Enterprise updated successfully: %s', updated_enterprise.model_dump())
-    return ResponseSchema(data=EnterpriseResponseSchema.model_validate(updated_enterprise))
+    data = schema.model_dump(exclude_unset=True)
+    logger.info('Updating enterprise with ID: %d', enterprise_id)
+    updated_enterprise = service.update(enterprise_id, data)
+    logger.info('Enterprise with ID %d updated successfully', enterprise_id)
+    return success_response(updated_enterprise.model_dump(mode='json'))
 
 @enterprise_router.delete(
     '/{enterprise_id}',
@@ -201,6 +242,31 @@ def link_ia_group_to_enterprise(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+@enterprise_router.post(
+    '/{enterprise_id}/iagroups',
+    summary='Link several IAGroups to an Enterprise',
+    response_description='Successfully linked IAGroups to Enterprise.'
+)
+def link_ia_groups_to_enterprise(
+    enterprise_id: int,
+    ia_group_ids: List[int],
+    service: EnterpriseService = Depends(get_enterprise_service)
+) -> Response:
+    """
+    Link a list of IAGroups to an Enterprise in one request.
+
+    Args:
+        enterprise_id (int): ID of the Enterprise.
+        ia_group_ids (List[int]): IDs of the IAGroups, sent as the JSON body.
+        service (EnterpriseService, optional): Service instance for Enterprise operations.
+
+    Returns:
+        Response: HTTP 204 No Content indicating successful linking.
+    """
+    service.link_ia_groups(enterprise_id, ia_group_ids)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @enterprise_router.delete(
     '/{enterprise_id}/iagroups/{ia_group_id}',
     summary='Unlink an IAGroup from an Enterprise',
@@ -230,14 +296,14 @@ def unlink_ia_group_from_enterprise(
 
 @enterprise_router.get(
     '/{enterprise_id}/iagroups',
-    response_model=ResponseSchema[List[int]],
+    response_model=_IdListResponse,
     summary='List IAGroup IDs linked to an Enterprise',
     response_description='Retrieve all IAGroup IDs linked to a specific Enterprise.'
 )
 def list_ia_groups_of_enterprise(
     enterprise_id: int,
     service: EnterpriseService = Depends(get_enterprise_service)
-) -> ResponseSchema[List[int]]:
+) -> ORJSONResponse:
     """
     Retrieve all IAGroup IDs linked to a given Enterprise.
 
@@ -246,9 +312,9 @@ def list_ia_groups_of_enterprise(
         service (EnterpriseService, optional): Service instance for Enterprise operations.
 
     Returns:
-        ResponseSchema[List[int]]: List of linked IAGroup IDs wrapped in a response schema.
+        ORJSONResponse: List of linked IAGroup IDs wrapped in the success envelope.
     """
     logger.info('Listing IAGroups linked to Enterprise %d', enterprise_id)
     ia_group_ids = service.list_ia_groups(enterprise_id)
     logger.info('Enterprise %d has %d linked IAGroups', enterprise_id, len(ia_group_ids))
-    return ResponseSchema(data=ia_group_ids)
\ No newline at end of file
+    return success_response(ia_group_ids)
\ No newline at end of file
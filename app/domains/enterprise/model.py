@@ -4,7 +4,7 @@ from app.core.sql_database import Base
 from app.domains.associations.enterprise_ia_group_association import enterprise_ia_group_association
 from app.domains.associations.user_enterprise_association import user_enterprise_association
 
-from sqlalchemy import String, Boolean
+from sqlalchemy import Index, String, Boolean, text, true
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class Enterprise(TimestampMixin, AuditMixin, Base):
@@ -20,12 +20,21 @@ class Enterprise(TimestampMixin, AuditMixin, Base):
             Enterprise X IA Group
     """
     __tablename__ = 'enterprise'
+    __table_args__ = (
+        # --- Partial index over active rows only (logical deletes stay out of it) ---
+        Index(
+            'ix_enterprise_active',
+            'id',
+            sqlite_where=text('status = 1'),
+            postgresql_where=text('status = true')
+        ),
+    )
     
-    id: Mapped[int] = mapped_column(primary_key=True, index=True, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(30), nullable=False)
     description: Mapped[str] = mapped_column(String(255), nullable=False)
     ia_model: Mapped[str] = mapped_column(String(50), nullable=False)
-    status: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    status: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default=true())
 
     ia_groups = relationship(
         'IAGroup',
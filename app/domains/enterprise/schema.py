@@ -1,24 +1,32 @@
 from datetime import datetime
 from typing import Annotated, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
+
+from app.api.api_schemas import ORMConstructMixin
+
+# --- Constrained string types, shared by the input schemas ---
+NameStr = Annotated[str, StringConstraints(min_length=3, max_length=30)]
+DescStr = Annotated[str, StringConstraints(min_length=10, max_length=255)]
+ModelStr = Annotated[str, StringConstraints(min_length=3, max_length=50)]
+AuditStr = Annotated[str, StringConstraints(min_length=3, max_length=50)]
 
 # --- Input Schema ---
 class EnterpriseCreateSchema(BaseModel):
     """Schema for creating a new enterprise."""
-    name: Annotated[str, Field(min_length=3, max_length=30, description='Name of the enterprise')]
-    description: Annotated[str, Field(min_length=10, max_length=255, description='Description of the enterprise')]
-    ia_model: Annotated[str, Field(min_length=3, max_length=50, description='AI model associated with the enterprise')]
-    created_by: Annotated[str, Field(min_length=3, max_length=50, description='User or system that created the enterprise')] = "system"
+    name: Annotated[NameStr, Field(description='Name of the enterprise')]
+    description: Annotated[DescStr, Field(description='Description of the enterprise')]
+    ia_model: Annotated[ModelStr, Field(description='AI model associated with the enterprise')]
+    created_by: Annotated[AuditStr, Field(description='User or system that created the enterprise')] = "system"
 
 class EnterpriseUpdateSchema(BaseModel):
     """Schema for updating an enterprise. All fields optional."""
-    name: Optional[Annotated[str, Field(min_length=3, max_length=30, description='Name of the enterprise')]] = None
-    description: Optional[Annotated[str, Field(min_length=10, max_length=255, description='Description of the enterprise')]] = None
-    ia_model: Optional[Annotated[str, Field(min_length=3, max_length=50, description='AI model associated with the enterprise')]] = None
-    updated_by: Annotated[str, Field(min_length=3, max_length=50, description='User or system that updated the enterprise')] = "system"
+    name: Optional[Annotated[NameStr, Field(description='Name of the enterprise')]] = None
+    description: Optional[Annotated[DescStr, Field(description='Description of the enterprise')]] = None
+    ia_model: Optional[Annotated[ModelStr, Field(description='AI model associated with the enterprise')]] = None
+    updated_by: Annotated[AuditStr, Field(description='User or system that updated the enterprise')] = "system"
 
 # --- Output Schema ---
-class EnterpriseResponseSchema(BaseModel):
+class EnterpriseResponseSchema(ORMConstructMixin, BaseModel):
     """Schema representing an enterprise for API responses."""
     id: int
     name: str
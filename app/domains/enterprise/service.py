@@ -1,11 +1,12 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 
-from app.core.logger import logger
+from app.core.logger import LazyDump, logger
 from app.repositories.base import BaseRepository
 from app.repositories.many_to_many import ManyToManyRepository
 from app.domains.enterprise.model import Enterprise
 from app.domains.ia_group.model import IAGroup, enterprise_ia_group_association
+from app.domains.ia_group.schema import IAGroupCreateSchema
 from app.domains.enterprise.schema import (
     EnterpriseCreateSchema, 
     EnterpriseUpdateSchema, 
@@ -13,13 +14,23 @@ from app.domains.enterprise.schema import (
 )
 
 from app.api.exceptions import NotFoundException
+from app.utils.etag import make_etag
+
+# --- Repository type parameterized once at import ---
+_EnterpriseRepository = BaseRepository[Enterprise, EnterpriseCreateSchema]
+_IAGroupRepository = BaseRepository[IAGroup, IAGroupCreateSchema]
+
+# --- Columns selected for the list; exactly the response fields ---
+_LIST_COLUMNS = tuple(EnterpriseResponseSchema.model_fields)
 
 class EnterpriseService:
     """
     Service class for managing enterprise entities.
     Handles creation and retrieval of enterprises via the repository.
     """
-    
+
+    __slots__ = ('_session', '_repository', '_ia_group_repository', '_many_to_many')
+
     def __init__(self, session: Session):
         """
         Initialize the service with a database session.
@@ -28,7 +39,8 @@ class EnterpriseService:
             session (Session): SQLAlchemy session for database operations.
         """
         self._session = session
-        self._repository = BaseRepository[Enterprise, EnterpriseCreateSchema](Enterprise, self._session)
+        self._repository = _EnterpriseRepository(Enterprise, self._session)
+        self._ia_group_repository = _IAGroupRepository(IAGroup, self._session)
         self._many_to_many = ManyToManyRepository(self._session, enterprise_ia_group_association)
 
     def create(self, schema: EnterpriseCreateSchema) -> EnterpriseResponseSchema:
@@ -41,24 +53,27 @@ class EnterpriseService:
         Returns:
             EnterpriseResponseSchema: The created enterprise as a response schema.
         """
-        logger.info('Creating a new enterprise with data: %s', schema.model_dump())
+        logger.info('Creating a new enterprise: %s', schema.name)
+        logger.debug('Enterprise data: %s', LazyDump(schema))
         enterprise = self._repository.create(schema)
-        validated_enterprise = EnterpriseResponseSchema.model_validate(enterprise)
-        logger.info('Enterprise created successfully: %s', validated_enterprise.model_dump())
+        validated_enterprise = EnterpriseResponseSchema.from_orm_fast(enterprise)
+        logger.info('Enterprise created successfully with ID: %d', validated_enterprise.id)
         return validated_enterprise
 
-    def list_all(self) -> List[EnterpriseResponseSchema]:
+    def list_all(self) -> List[Dict[str, Any]]:
         """
-        Retrieve all enterprises from the database.
+        Retrieve all enterprises as plain dicts of the response columns.
+
+        For read-only endpoints that serialize the list straight away: the
+        rows skip schema validation and are handed to orjson as they are.
 
         Returns:
-            List[EnterpriseResponseSchema]: List of enterprises as response schemas.
+            List[Dict[str, Any]]: One dict per enterprise, keyed by response field.
         """
         logger.info('Retrieving all enterprises from the database')
-        enterprises = self._repository.get_all()
-        validated_enterprises = [EnterpriseResponseSchema.model_validate(ent) for ent in enterprises]
-        logger.info('Retrieved %d enterprises', len(validated_enterprises))
-        return validated_enterprises
+        enterprises = [row._asdict() for row in self._repository.get_all_rows(_LIST_COLUMNS)]
+        logger.info('Retrieved %d enterprises', len(enterprises))
+        return enterprises
 
     def list_by_id(self, id: int) -> EnterpriseResponseSchema:
         """
@@ -77,17 +92,44 @@ class EnterpriseService:
             logger.warning('Enterprise with ID %d not found', id)
             raise NotFoundException('Enterprise', id)
         
-        validated_enterprise = EnterpriseResponseSchema.model_validate(enterprise)
-        logger.info('Enterprise retrieved successfully: %s', validated_enterprise.model_dump())
+        validated_enterprise = EnterpriseResponseSchema.from_orm_fast(enterprise)
+        logger.debug('Enterprise retrieved successfully: %s', LazyDump(validated_enterprise))
         return validated_enterprise
     
-    def update(self, id: int, schema: EnterpriseUpdateSchema) -> EnterpriseResponseSchema:
+    def get_etag(self, id: int) -> Optional[str]:
+        """
+        Compute the ETag of an enterprise from its last change, without loading it.
+
+        Args:
+            id (int): Unique identifier of the enterprise.
+
+        Returns:
+            Optional[str]: The weak ETag, or None if no active enterprise has this ID.
+        """
+        version = self._repository.get_version(id)
+        return make_etag(id, version) if version is not None else None
+
+    def get_list_etag(self) -> str:
+        """
+        Compute the ETag of the active enterprise list from an aggregate query.
+
+        Returns:
+            str: The weak ETag of the current list.
+        """
+        count, max_id, last_changed = self._repository.get_collection_version()
+        return make_etag(count, max_id, last_changed)
+
+    def update(self, id: int, data: Dict[str, Any]) -> EnterpriseResponseSchema:
         """
         Update an existing enterprise by its ID.
 
+        The change and the lookup are a single UPDATE ... RETURNING; only a
+        request with nothing to change falls back to a plain read.
+
         Args:
             id (int): The ID of the enterprise to update.
-            schema (EnterpriseUpdateSchema): The data to update the enterprise with.
+            data (Dict[str, Any]): Fields explicitly set on the EnterpriseUpdateSchema
+                (`model_dump(exclude_unset=True)`); empty means nothing to update.
 
         Raises:
             NotFoundException: If the enterprise with the given ID does not exist.
@@ -95,16 +137,16 @@ class EnterpriseService:
         Returns:
             EnterpriseResponseSchema: The updated enterprise data.
         """
-        logger.info('Updating enterprise with ID: %d using data: %s', id, schema.model_dump())
-        enterprise = self._repository.get_by_id(id)
+        logger.info('Updating enterprise with ID: %d', id)
+        logger.debug('Enterprise update data: %s', data)
+        updated_enterprise = self._repository.update_by_id(id, data) if data else self._repository.get_by_id(id)
         
-        if not enterprise:
+        if not updated_enterprise:
             logger.warning('Enterprise with ID %d not found for update', id)
             raise NotFoundException("Enterprise", id)
 
-        updated_enterprise = self._repository.update(enterprise, schema)
-        validated_enterprise = EnterpriseResponseSchema.model_validate(updated_enterprise)
-        logger.info('Enterprise updated successfully: %s', validated_enterprise.model_dump())
+        validated_enterprise = EnterpriseResponseSchema.from_orm_fast(updated_enterprise)
+        logger.info('Enterprise with ID %d updated successfully', id)
         return validated_enterprise
     
     def delete(self, id: int) -> None:
@@ -118,13 +160,10 @@ class EnterpriseService:
             NotFoundException: If no enterprise with the given ID exists.
         """
         logger.info('Deleting enterprise with ID: %d', id)
-        enterprise = self._repository.get_by_id(id)
-        
-        if not enterprise:
+        if not self._repository.delete_by_id(id):
             logger.warning('Enterprise with ID %d not found for deletion', id)
             raise NotFoundException("Enterprise", id)
 
-        self._repository.delete(enterprise)
         logger.info('Enterprise with ID %d deleted successfully', id)
   
     def logical_delete(self, id: int) -> None:
@@ -142,47 +181,87 @@ class EnterpriseService:
             NotFoundException: If no enterprise with the given ID exists.
         """
         logger.info('Starting logical deletion for enterprise with ID: %d', id)
-        enterprise = self._repository.get_by_id(id)
-        
-        if not enterprise:
+        if not self._repository.logical_delete_by_id(id):
             logger.warning('Enterprise with ID %d not found for logical deletion', id)
             raise NotFoundException("Enterprise", id)
         
-        self._repository.logical_delete(enterprise)
         logger.info('Logical deletion completed: Enterprise with ID %d is now inactive', id)
     
     def link_ia_group(self, enterprise_id: int, ia_group_id: int) -> None:
         """
         Link an IAGroup to an Enterprise.
 
+        The link is inserted only if both rows exist and are active, in one
+        statement. Only when nothing was inserted are the two rows looked up,
+        to tell a missing or inactive row from a link that already existed.
+
         Args:
             enterprise_id (int): The ID of the enterprise to which the IAGroup will be linked.
             ia_group_id (int): The ID of the IAGroup to be linked.
 
         Raises:
-            NotFoundException: If the Enterprise with the given ID does not exist.
-            NotFoundException: If the IAGroup with the given ID does not exist.
+            NotFoundException: If no active Enterprise with the given ID exists.
+            NotFoundException: If no active IAGroup with the given ID exists.
         """
         logger.info('Linking IAGroup %d to Enterprise %d', ia_group_id, enterprise_id)
-        
-        enterprise = self._repository.get_by_id(enterprise_id)
-        if not enterprise:
-            logger.warning('Enterprise with ID %d not found for linking', enterprise_id)
-            raise NotFoundException('Enterprise', enterprise_id)
-        
-        ia_group = self._session.get(IAGroup, ia_group_id)
-        if not ia_group:
-            logger.warning('IAGroup with ID %d not found for linking', ia_group_id)
-            raise NotFoundException('IAGroup', ia_group_id)
-        
-        self._many_to_many.link(
+        linked = self._many_to_many.link_active(
             enterprise_id,
-            ia_group_id,
+            [ia_group_id],
             left_key='enterprise_id',
-            right_key='ia_group_id'
+            right_key='ia_group_id',
+            left_table=Enterprise.__table__,
+            right_table=IAGroup.__table__
         )
+        if not linked:
+            if self._repository.get_by_id(enterprise_id) is None:
+                logger.warning('Enterprise with ID %d not found for linking', enterprise_id)
+                raise NotFoundException('Enterprise', enterprise_id)
+            if self._ia_group_repository.get_by_id(ia_group_id) is None:
+                logger.warning('IAGroup with ID %d not found for linking', ia_group_id)
+                raise NotFoundException('IAGroup', ia_group_id)
         logger.info('IAGroup %d successfully linked to Enterprise %d', ia_group_id, enterprise_id)
 
+    def link_ia_groups(self, enterprise_id: int, ia_group_ids: List[int]) -> None:
+        """
+        Link several IAGroups to an Enterprise with a single multi-row insert.
+
+        As in `link_ia_group`, only active rows are linked and existing links
+        are kept as they are. The rows are only looked up
+        when fewer links than IDs were inserted, to report the first missing
+        or inactive one. An empty list links nothing but still requires the
+        enterprise to exist.
+
+        Args:
+            enterprise_id (int): The ID of the enterprise to which the IAGroups will be linked.
+            ia_group_ids (List[int]): The IDs of the IAGroups to be linked.
+
+        Raises:
+            NotFoundException: If no active Enterprise with the given ID exists.
+            NotFoundException: If any of the given IDs has no active IAGroup.
+        """
+        logger.info('Linking %d IAGroups to Enterprise %d', len(ia_group_ids), enterprise_id)
+        unique_ids = list(dict.fromkeys(ia_group_ids))
+        linked = 0
+        if unique_ids:
+            linked = self._many_to_many.link_active(
+                enterprise_id,
+                unique_ids,
+                left_key='enterprise_id',
+                right_key='ia_group_id',
+                left_table=Enterprise.__table__,
+                right_table=IAGroup.__table__
+            )
+        if not unique_ids or linked < len(unique_ids):
+            if self._repository.get_by_id(enterprise_id) is None:
+                logger.warning('Enterprise with ID %d not found for linking', enterprise_id)
+                raise NotFoundException('Enterprise', enterprise_id)
+            active = self._ia_group_repository.get_active_ids(unique_ids) if unique_ids else set()
+            missing = next((ia_group_id for ia_group_id in unique_ids if ia_group_id not in active), None)
+            if missing is not None:
+                logger.warning('IAGroup with ID %d not found for linking', missing)
+                raise NotFoundException('IAGroup', missing)
+        logger.info('%d new IAGroup links created for Enterprise %d', linked, enterprise_id)
+
     def unlink_ia_group(self, enterprise_id: int, ia_group_id: int) -> None:
         """
         Unlink an IAGroup from an Enterprise.
@@ -217,4 +296,4 @@ class EnterpriseService:
             right_key='ia_group_id'
         )
         logger.info('Enterprise %d has %d linked IAGroups', enterprise_id, len(ia_group_ids))
-        return ia_group_ids
\ No newline at end of file
+        return ia_group_ids
@@ -1,9 +1,9 @@
-from typing import List, cast
+from typing import List
 
 from app.core.logger import logger
 from app.domains.ia_group.service import IAGroupService
 from app.api.dependencies import get_ia_group_service
-from app.api.api_schemas import ResponseSchema
+from app.api.api_schemas import ResponseSchema, success_response
 from app.domains.ia_group.schema import (
     IAGroupCreateSchema, 
     IAGroupUpdateSchema,
@@ -11,16 +11,22 @@ from app.domains.ia_group.schema import (
 )
 
 from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import ORJSONResponse
 
 ia_group_router = APIRouter(
     prefix='/ia_group',
     tags=['IAGroup']
 )
 
+# --- Response envelopes parameterized once at import ---
+_IAGroupResponse = ResponseSchema[IAGroupResponseSchema]
+_IAGroupListResponse = ResponseSchema[List[IAGroupResponseSchema]]
+_IdListResponse = ResponseSchema[List[int]]
+
 # --- CRUD Routes ---
 @ia_group_router.post(
     '/',
-    response_model=ResponseSchema[IAGroupResponseSchema],
+    response_model=_IAGroupResponse,
     status_code=status.HTTP_201_CREATED,
     summary='Create a new IA Group',
     response_description='New IA Group created.'
@@ -28,7 +34,7 @@ ia_group_router = APIRouter(
 def create_ia_group(
     schema: IAGroupCreateSchema,
     service: IAGroupService = Depends(get_ia_group_service)
-) -> ResponseSchema[IAGroupResponseSchema]:
+) -> ORJSONResponse:
     """
     Create a new IA Group using the provided schema.
 
@@ -37,23 +43,23 @@ def create_ia_group(
         service (IAGroupService, optional): Service instance. Defaults to Depends(get_ia_group_service).
 
     Returns:
-        ResponseSchema[IAGroupResponseSchema]: Created IA Group wrapped in a response schema.
+        ORJSONResponse: Created IA Group wrapped in the success envelope.
     """
-    logger.info('Creating a new IA Group with data: %s', schema.model_dump())
+    logger.info('Creating a new IA Group: %s', schema.name)
     ia_group = service.create(schema)
     logger.info('IA Group created successfully with ID: %s', ia_group.id)
-    return cast(ResponseSchema[IAGroupResponseSchema], ResponseSchema(data=ia_group))
+    return success_response(ia_group.model_dump(mode='json'), status_code=status.HTTP_201_CREATED)
 
 @ia_group_router.get(
     '/',
-    response_model=ResponseSchema[List[IAGroupResponseSchema]],
+    response_model=_IAGroupListResponse,
     status_code=status.HTTP_200_OK,
     summary='List all IA Groups',
     response_description='List of all registered IA Groups.'
 )
 def list_all_ia_groups(
     service: IAGroupService = Depends(get_ia_group_service)
-) -> ResponseSchema[List[IAGroupResponseSchema]]:
+) -> ORJSONResponse:
     """
     Retrieve a list of all registered IA Groups.
 
@@ -61,23 +67,20 @@ def list_all_ia_groups(
         service (IAGroupService, optional): Service instance. Defaults to Depends(get_ia_group_service).
 
     Returns:
-        ResponseSchema[List[IAGroupResponseSchema]]: List of IA Groups wrapped in a response schema.
+        ORJSONResponse: List of IA Groups wrapped in the success envelope.
     """
-    logger.info('Retrieving all IA Groups from the database')
-    ia_groups = service.list_all()
-    logger.info('Retrieved %d IA Groups', len(ia_groups))
-    return cast(ResponseSchema[List[IAGroupResponseSchema]], ResponseSchema(data=ia_groups))
+    return success_response(service.list_all())
 
 @ia_group_router.get(
     '/{ia_group_id}',
-    response_model=ResponseSchema[IAGroupResponseSchema],
+    response_model=_IAGroupResponse,
     summary='Query IA Group by ID',
     response_description='List the specified IA Group.'
 )
 def list_by_id(
     ia_group_id: int,
     service: IAGroupService = Depends(get_ia_group_service)
-) -> ResponseSchema[IAGroupResponseSchema]:
+) -> ORJSONResponse:
     """
     Retrieve an IA Group by its ID.
 
@@ -86,16 +89,16 @@ def list_by_id(
         service (IAGroupService, optional): Service handling IA Group operations. Defaults to Depends(get_ia_group_service).
 
     Returns:
-        ResponseSchema[IAGroupResponseSchema]: The IA Group data wrapped in a response schema.
+        ORJSONResponse: The IA Group data wrapped in the success envelope.
     """
     logger.info('Retrieving IA Group with ID: %d', ia_group_id)
     ia_group = service.list_by_id(ia_group_id)
-    logger.info('IA Group retrieved successfully: %s', ia_group.model_dump())
-    return cast(ResponseSchema[IAGroupResponseSchema], ResponseSchema(data=ia_group))
+    logger.info('IA Group with ID %d retrieved successfully', ia_group_id)
+    return success_response(ia_group.model_dump(mode='json'))
 
 @ia_group_router.put(
     '/{ia_group_id}',
-    response_model=ResponseSchema[IAGroupResponseSchema],
+    response_model=_IAGroupResponse,
     summary='Update IA Group by ID',
     response_description='Update a specific IA Group.'
 )
@@ -103,7 +106,7 @@ def update_by_id(
     ia_group_id: int,
     schema: IAGroupUpdateSchema,
     service: IAGroupService = Depends(get_ia_group_service)
-) -> ResponseSchema[IAGroupResponseSchema]:
+) -> ORJSONResponse:
     """
     Update an existing IA Group by its ID.
 
@@ -113,12 +116,12 @@ def update_by_id(
         service (IAGroupService, optional): Service handling IA Group operations. Defaults to Depends(get_ia_group_service).
 
     Returns:
-        ResponseSchema[IAGroupResponseSchema]: The updated IA Group data wrapped in a response schema.
+        ORJSONResponse: The updated IA Group data wrapped in the success envelope.
     """
-    logger.info('Updating IA Group with ID: %d using data: %s', ia_group_id, schema.model_dump())
+    logger.info('Updating IA Group with ID: %d', ia_group_id)
     updated_ia_group = service.update(ia_group_id, schema)
-    logger.info('IA Group updated successfully: %s', updated_ia_group.model_dump())
-    return ResponseSchema(data=IAGroupResponseSchema.model_validate(updated_ia_group))
+    logger.info('IA Group with ID %d updated successfully', ia_group_id)
+    return success_response(updated_ia_group.model_dump(mode='json'))
 
 @ia_group_router.delete(
     '/{ia_group_id}',
@@ -206,14 +209,14 @@ def unlink_agent_from_ia_group(
 
 @ia_group_router.get(
     '/{ia_group_id}/agents',
-    response_model=ResponseSchema[List[int]],
+    response_model=_IdListResponse,
     summary='List Agents linked to an IA Group',
     response_description='Retrieve all Agent IDs linked to a specific IA Group.'
 )
 def list_agents_of_ia_group(
     ia_group_id: int,
     service: IAGroupService = Depends(get_ia_group_service)
-) -> ResponseSchema[List[int]]:
+) -> ORJSONResponse:
     """
     Retrieve all Agents linked to a given IA Group.
 
@@ -222,9 +225,9 @@ def list_agents_of_ia_group(
         service (IAGroupService, optional): Service instance for IA Group operations.
 
     Returns:
-        ResponseSchema[List[int]]: List of linked Agent IDs wrapped in a response schema.
+        ORJSONResponse: List of linked Agent IDs wrapped in the success envelope.
     """
     logger.info('Listing Agents linked to IA Group %d', ia_group_id)
     agent_ids = service.list_agents(ia_group_id)
     logger.info('IA Group %d has %d linked Agents', ia_group_id, len(agent_ids))
-    return ResponseSchema(data=agent_ids)
+    return success_response(agent_ids)
@@ -4,7 +4,7 @@ from app.core.sql_database import Base
 from app.domains.associations.enterprise_ia_group_association import enterprise_ia_group_association
 from app.domains.associations.ia_group_agent_association import ia_group_agent_association
 
-from sqlalchemy import String, Boolean
+from sqlalchemy import Index, String, Boolean, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class IAGroup(TimestampMixin, AuditMixin, Base):
@@ -19,8 +19,17 @@ class IAGroup(TimestampMixin, AuditMixin, Base):
             IA Group X Enterprise
     """
     __tablename__ = 'ia_group'
+    __table_args__ = (
+        # --- Partial index over active rows only (logical deletes stay out of it) ---
+        Index(
+            'ix_ia_group_active',
+            'id',
+            sqlite_where=text('status = 1'),
+            postgresql_where=text('status = true')
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(30), nullable=False)
     description: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
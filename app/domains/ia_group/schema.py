@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Annotated, Optional
 from pydantic import BaseModel, Field
+from app.api.api_schemas import ORMConstructMixin
 
 # --- Input Schema ---
 class IAGroupCreateSchema(BaseModel):
@@ -16,7 +17,7 @@ class IAGroupUpdateSchema(BaseModel):
     updated_by: Annotated[str, Field(min_length=3, max_length=50, description='User or system that updated the ia_group')] = "system"
 
 # --- Output Schema ---
-class IAGroupResponseSchema(BaseModel):
+class IAGroupResponseSchema(ORMConstructMixin, BaseModel):
     """Schema representing an IA Group for API responses."""
     id: int
     name: str
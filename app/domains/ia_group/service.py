@@ -1,7 +1,7 @@
-from typing import List
+from typing import Any, Dict, List
 from sqlalchemy.orm import Session
 
-from app.core.logger import logger
+from app.core.logger import LazyDump, logger
 from app.repositories.base import BaseRepository
 from app.repositories.many_to_many import ManyToManyRepository
 from app.domains.ia_group.model import IAGroup, ia_group_agent_association
@@ -14,6 +14,12 @@ from app.domains.ia_group.schema import (
 
 from app.api.exceptions import NotFoundException
 
+# --- Repository type parameterized once at import ---
+_IAGroupRepository = BaseRepository[IAGroup, IAGroupCreateSchema]
+
+# --- Columns selected for the plain-row list; exactly the response fields ---
+_LIST_COLUMNS = tuple(IAGroupResponseSchema.model_fields)
+
 class IAGroupService:
     """
     Service class for managing IA Group entities.
@@ -28,7 +34,7 @@ class IAGroupService:
             session (Session): SQLAlchemy session for database operations.
         """
         self._session = session
-        self._repository = BaseRepository[IAGroup, IAGroupCreateSchema](IAGroup, self._session)
+        self._repository = _IAGroupRepository(IAGroup, self._session)
         self._many_to_many = ManyToManyRepository(self._session, ia_group_agent_association)
 
     def create(self, schema: IAGroupCreateSchema) -> IAGroupResponseSchema:
@@ -41,24 +47,27 @@ class IAGroupService:
         Returns:
             IAGroupResponseSchema: The created IA Group as a response schema.
         """
-        logger.info('Creating a new IA Group with data: %s', schema.model_dump())
+        logger.info('Creating a new IA Group: %s', schema.name)
+        logger.debug('IA Group data: %s', LazyDump(schema))
         ia_group = self._repository.create(schema)
-        validated_ia_groups = IAGroupResponseSchema.model_validate(ia_group)
-        logger.info('IA Group created successfully: %s', validated_ia_groups.model_dump())
+        validated_ia_groups = IAGroupResponseSchema.from_orm_fast(ia_group)
+        logger.info('IA Group created successfully with ID: %d', validated_ia_groups.id)
         return validated_ia_groups
 
-    def list_all(self) -> List[IAGroupResponseSchema]:
+    def list_all(self) -> List[Dict[str, Any]]:
         """
-        Retrieve all IA Groups from the database.
+        Retrieve all IA Groups as plain dicts of the response columns.
+
+        For read-only endpoints that serialize the list straight away: the
+        rows skip schema validation and are handed to orjson as they are.
 
         Returns:
-            List[IAGroupResponseSchema]: List of IA Groups as response schemas.
+            List[Dict[str, Any]]: One dict per IA Group, keyed by response field.
         """
         logger.info('Retrieving all IA Groups from the database')
-        ia_groups = self._repository.get_all()
-        validated_ia_groups = [IAGroupResponseSchema.model_validate(grp) for grp in ia_groups]
-        logger.info('Retrieved %d IA Groups', len(validated_ia_groups))
-        return validated_ia_groups
+        ia_groups = [row._asdict() for row in self._repository.get_all_rows(_LIST_COLUMNS)]
+        logger.info('Retrieved %d IA Groups', len(ia_groups))
+        return ia_groups
 
     def list_by_id(self, id: int) -> IAGroupResponseSchema:
         """
@@ -77,8 +86,8 @@ class IAGroupService:
             logger.warning('IA Group with ID %d not found', id)
             raise NotFoundException('IA Group', id)
         
-        validated_ia_group = IAGroupResponseSchema.model_validate(ia_group)
-        logger.info('IA Group retrieved successfully: %s', validated_ia_group.model_dump())
+        validated_ia_group = IAGroupResponseSchema.from_orm_fast(ia_group)
+        logger.debug('IA Group retrieved successfully: %s', LazyDump(validated_ia_group))
         return validated_ia_group
     
     def update(self, id: int, schema: IAGroupUpdateSchema) -> IAGroupResponseSchema:
@@ -95,7 +104,8 @@ class IAGroupService:
         Returns:
             IAGroupResponseSchema: The updated IA Group data.
         """
-        logger.info('Updating IA Group with ID: %d using data: %s', id, schema.model_dump())
+        logger.info('Updating IA Group with ID: %d', id)
+        logger.debug('IA Group update data: %s', LazyDump(schema))
         ia_group = self._repository.get_by_id(id)
         
         if not ia_group:
@@ -103,8 +113,8 @@ class IAGroupService:
             raise NotFoundException("IA Group", id)
 
         updated_ia_group = self._repository.update(ia_group, schema)
-        validated_ia_group = IAGroupResponseSchema.model_validate(updated_ia_group)
-        logger.info('IA Group updated successfully: %s', validated_ia_group.model_dump())
+        validated_ia_group = IAGroupResponseSchema.from_orm_fast(updated_ia_group)
+        logger.info('IA Group with ID %d updated successfully', id)
         return validated_ia_group
     
     def delete(self, id: int) -> None:
@@ -1,8 +1,23 @@
+from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
 
+
+def _utc_now() -> datetime:
+    """
+    Return the current UTC time with microseconds.
+
+    Used for `updated_at` instead of the database clock, which on SQLite only
+    has second resolution, so every update yields a distinct version.
+
+    Returns:
+        datetime: Current timezone-aware UTC datetime.
+    """
+    return datetime.now(timezone.utc)
+
+
 class TimestampMixin:
     """Mixin that adds timestamp information to a model.
 
@@ -11,7 +26,7 @@ class TimestampMixin:
         updated_at (Mapped[Optional[DateTime]]): The datetime when the record was last updated. Automatically set on update, optional.
     """
     created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
-    updated_at: Mapped[Optional[DateTime]] = mapped_column(DateTime, nullable=True, onupdate=func.now())
+    updated_at: Mapped[Optional[DateTime]] = mapped_column(DateTime, nullable=True, onupdate=_utc_now)
 
     def __repr__(self) -> str:
         """Returns a string representation of the timestamp information.
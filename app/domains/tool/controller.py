@@ -1,4 +1,4 @@
-from typing import List, cast
+from typing import List
 
 from app.core.logger import logger
 from app.domains.tool.service import ToolService
@@ -41,7 +41,7 @@ def create_tool(
     logger.info('Creating a new Tool with data: %s', schema.model_dump())
     tool = service.create(schema)
     logger.info('Tool created successfully with ID: %s', tool.id)
-    return cast(ResponseSchema[ToolResponseSchema], ResponseSchema(data=tool))
+    return ResponseSchema[ToolResponseSchema].model_construct(data=tool)
 
 @tool_router.get(
     '/',
@@ -65,7 +65,7 @@ def list_all_tools(
     logger.info('Retrieving all Tools from the database')
     tools = service.list_all()
     logger.info('Retrieved %d Tools', len(tools))
-    return cast(ResponseSchema[List[ToolResponseSchema]], ResponseSchema(data=tools))
+    return ResponseSchema[List[ToolResponseSchema]].model_construct(data=tools)
 
 @tool_router.get(
     '/{tool_id}',
@@ -90,7 +90,7 @@ def list_by_id(
     logger.info('Retrieving Tool with ID: %d', tool_id)
     tool = service.list_by_id(tool_id)
     logger.info('Tool retrieved successfully: %s', tool.model_dump())
-    return cast(ResponseSchema[ToolResponseSchema], ResponseSchema(data=tool))
+    return ResponseSchema[ToolResponseSchema].model_construct(data=tool)
 
 @tool_router.put(
     '/{tool_id}',
@@ -117,7 +117,7 @@ def update_by_id(
     logger.info('Updating Tool with ID: %d using data: %s', tool_id, schema.model_dump())
     updated_tool = service.update(tool_id, schema)
     logger.info('Tool updated successfully: %s', updated_tool.model_dump())
-    return ResponseSchema(data=ToolResponseSchema.model_validate(updated_tool))
+    return ResponseSchema[ToolResponseSchema].model_construct(data=updated_tool)
 
 @tool_router.delete(
     '/{tool_id}',
@@ -18,7 +18,7 @@ class Tool(TimestampMixin, AuditMixin, Base):
     """
     __tablename__ = 'tool'
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(30), nullable=False)
     description: Mapped[str] = mapped_column(String(255), nullable=False)
     path: Mapped[str] = mapped_column(String(255), nullable=False)
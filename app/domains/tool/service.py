@@ -12,6 +12,9 @@ from app.domains.tool.schema import (
 
 from app.api.exceptions import NotFoundException
 
+# --- Repository type parameterized once at import ---
+_ToolRepository = BaseRepository[Tool, ToolCreateSchema]
+
 class ToolService:
     """
     Service class for managing Tool entities.
@@ -26,7 +29,7 @@ class ToolService:
             session (Session): SQLAlchemy session for database operations.
         """
         self._session = session
-        self._repository = BaseRepository[Tool, ToolCreateSchema](Tool, self._session)
+        self._repository = _ToolRepository(Tool, self._session)
 
     def create(self, schema: ToolCreateSchema) -> ToolResponseSchema:
         """
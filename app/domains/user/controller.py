@@ -1,4 +1,4 @@
-from typing import List, cast
+from typing import List
 
 from app.core.logger import logger
 from app.domains.user.service import UserService
@@ -42,7 +42,7 @@ def create_user(
     logger.info('Creating a new User with data: %s', schema.model_dump())
     user = service.create(schema)
     logger.info('User created successfully with ID: %s', user.id)
-    return cast(ResponseSchema[UserResponseSchema], ResponseSchema(data=user))
+    return ResponseSchema[UserResponseSchema].model_construct(data=user)
 
 @user_router.get(
     '/',
@@ -66,7 +66,7 @@ def list_all_users(
     logger.info('Retrieving all Users from the database')
     users = service.list_all()
     logger.info('Retrieved %d Users', len(users))
-    return cast(ResponseSchema[List[UserResponseSchema]], ResponseSchema(data=users))
+    return ResponseSchema[List[UserResponseSchema]].model_construct(data=users)
 
 @user_router.get(
     '/{user_id}',
@@ -91,7 +91,7 @@ def list_by_id(
     logger.info('Retrieving User with ID: %d', user_id)
     user = service.list_by_id(user_id)
     logger.info('User retrieved successfully: %s', user.model_dump())
-    return cast(ResponseSchema[UserResponseSchema], ResponseSchema(data=user))
+    return ResponseSchema[UserResponseSchema].model_construct(data=user)
 
 @user_router.put(
     '/{user_id}',
@@ -118,7 +118,7 @@ def update_by_id(
     logger.info('Updating User with ID: %d using data: %s', user_id, schema.model_dump())
     updated_user = service.update(user_id, schema)
     logger.info('User updated successfully: %s', updated_user.model_dump())
-    return ResponseSchema(data=UserResponseSchema.model_validate(updated_user))
+    return ResponseSchema[UserResponseSchema].model_construct(data=updated_user)
 
 @user_router.delete(
     '/{user_id}',
@@ -227,4 +227,4 @@ def list_enterprises_of_user(
     logger.info('Listing Enterprises linked to User %d', user_id)
     enterprise_ids = service.list_enterprises(user_id)
     logger.info('User %d is linked to %d Enterprises', user_id, len(enterprise_ids))
-    return ResponseSchema(data=enterprise_ids)
\ No newline at end of file
+    return ResponseSchema[List[int]].model_construct(data=enterprise_ids)
\ No newline at end of file
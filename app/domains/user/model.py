@@ -17,7 +17,7 @@ class User(TimestampMixin, AuditMixin, Base):
     """
     __tablename__ = 'user'
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(30), nullable=False)
     email: Mapped[str] = mapped_column(String(30), nullable=False, unique=True)
     password: Mapped[str] = mapped_column(String(128), nullable=False)
@@ -14,6 +14,9 @@ from app.utils.security import hash_password
 
 from app.api.exceptions import NotFoundException
 
+# --- Repository type parameterized once at import ---
+_UserRepository = BaseRepository[User, UserCreateSchema]
+
 class UserService:
     """
     Service class for managing User entities.
@@ -28,7 +31,7 @@ class UserService:
             session (Session): SQLAlchemy session for database operations.
         """
         self._session = session
-        self._repository = BaseRepository[User, UserCreateSchema](User, self._session)
+        self._repository = _UserRepository(User, self._session)
         self._many_to_many = ManyToManyRepository(session, user_enterprise_association)
 
     def create(self, schema: UserCreateSchema) -> UserResponseSchema:
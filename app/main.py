@@ -1,18 +1,79 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from app.domains.enterprise.controller import enterprise_router
 from app.domains.ia_group.controller import ia_group_router
 from app.domains.agent.controller import agent_router
 from app.domains.tool.controller import tool_router
 from app.domains.user.controller import user_router
 from app.api.exception_handlers import register_exception_handlers
+from app.api.middleware import DBSessionMiddleware
+from app.core.environment import settings
+from app.core.logger import logger
+from app.core.sql_database import db
 
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.pool import QueuePool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Configure process-wide resources before the application starts serving.
+
+    Sync endpoints and their database calls run on AnyIO's default threadpool,
+    whose size caps how many requests can wait on the database at once. With
+    a bounded connection pool the threadpool is capped at the pool capacity:
+    a worker beyond it could only park on connection checkout, so extra
+    requests wait on the event loop instead of holding threads.
+
+    When the docs are enabled, the OpenAPI schema is generated here once, so
+    no request pays for walking every route's response model.
+
+    Up to DB_POOL_PREWARM pooled connections are opened before serving, so
+    the first burst of requests does not pay for connection setup.
+
+    Args:
+        app (FastAPI): The FastAPI application instance.
+    """
+    threadpool_size = settings.THREADPOOL_SIZE
+    if isinstance(db.engine.pool, QueuePool):
+        threadpool_size = min(threadpool_size, settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    to_thread.current_default_thread_limiter().total_tokens = threadpool_size
+    logger.info('Threadpool sized to %d workers', threadpool_size)
+
+    # --- Open pooled connections before the first requests need them ---
+    if isinstance(db.engine.pool, QueuePool) and settings.DB_POOL_PREWARM > 0:
+        opened = await to_thread.run_sync(db.prewarm, settings.DB_POOL_PREWARM)
+        logger.info('Connection pool prewarmed with %d connections', opened)
+
+    # --- Build the OpenAPI schema now instead of on the first docs request ---
+    if app.openapi_url:
+        app.openapi()
+    yield
+
+
+# --- Interactive docs and the OpenAPI schema are not served in production ---
+_DOCS_ENABLED = settings.ENVIRONMENT != 'production'
 
 app = FastAPI(
     title='Luminous Neural', 
     description='Luminous Neural is a system of collaborative AI agents that learn, reason, and evolve together.',
-    version='0.1.0'
+    version='0.1.0',
+    docs_url='/docs' if _DOCS_ENABLED else None,
+    redoc_url='/redoc' if _DOCS_ENABLED else None,
+    openapi_url='/openapi.json' if _DOCS_ENABLED else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# --- Middlewares ---
+app.add_middleware(DBSessionMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # --- HTTP Routes ---
 app.include_router(user_router)
 app.include_router(enterprise_router)
@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
-from typing import Type, TypeVar, Generic, List, Optional
+from typing import Any, Dict, Iterator, Sequence, Set, Type, TypeVar, Generic, List, Optional, Union
 
 from pydantic import BaseModel
+from sqlalchemy import Delete, Row, Select, Update, delete, func, insert, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ExecutableOption
 
-from app.core.logger import logger
+from app.core.logger import LazyDump, logger
 from app.core.sql_database import Base
 
 T = TypeVar("T", bound=Base)
@@ -16,7 +18,8 @@ class BaseRepository(Generic[T, Schema]):
     """Generic repository providing CRUD operations for SQLAlchemy models using Pydantic Schemas.
 
     This repository enforces that all create and update operations use validated Pydantic Schemas,
-    ensuring data consistency and type safety.
+    ensuring data consistency and type safety. Writes are only flushed; the request's
+    transaction is committed once by `DBSessionMiddleware`.
 
     Attributes:
         model (Type[T]): The SQLAlchemy model class this repository manages.
@@ -43,35 +46,136 @@ class BaseRepository(Generic[T, Schema]):
         Returns:
             T: The newly created SQLAlchemy model instance with updated database state (including autogenerated fields).
         """
-        logger.debug('Creating a new %s with data: %s', self.model.__name__, obj_in.model_dump())
+        logger.debug('Creating a new %s with data: %s', self.model.__name__, LazyDump(obj_in))
         obj = self.model(**obj_in.model_dump())
         self.session.add(obj)
-        self.session.commit()
+        self.session.flush()
         self.session.refresh(obj)
         logger.debug('%s created with ID: %s', self.model.__name__, obj.id)
         return obj
 
-    def get_all(self) -> List[T]:
+    def create_many(self, objs_in: List[Schema]) -> Sequence[Row[Any]]:
+        """
+        Insert several records with a single multi-row INSERT ... RETURNING.
+
+        Rows bypass the unit of work (no identity map, no cascades), so they are
+        returned as plain result rows carrying every table column, including
+        autogenerated ones, rather than as tracked model instances.
+
+        Args:
+            objs_in (List[Schema]): Pydantic schemas containing validated fields for the new records.
+
+        Returns:
+            Sequence[Row[Any]]: One row per created record, in insertion order.
+        """
+        if not objs_in:
+            return []
+
+        logger.debug('Creating %d %s records in bulk', len(objs_in), self.model.__name__)
+        table = self.model.__table__
+        rows = self.session.execute(
+            insert(table).returning(*table.c, sort_by_parameter_order=True),
+            [obj_in.model_dump() for obj_in in objs_in]
+        ).all()
+        logger.debug('%d %s records created', len(rows), self.model.__name__)
+        return rows
+
+    def get_all(self, options: Sequence[ExecutableOption] = ()) -> List[T]:
         """
         Retrieve all records of the model from the database with status=True.
 
+        Args:
+            options (Sequence[ExecutableOption], optional): Loader options applied to the
+                query, e.g. `selectinload(...)` to batch-load relationships the caller
+                reads, or `raiseload('*')` to forbid lazy loads. Defaults to none.
+
         Returns:
             List[T]: A list of all model instances where status is True.
         """
         logger.debug('Retrieving all %s records from the database', self.model.__name__)
         query = self.session.query(self.model)
+        if options:
+            query = query.options(*options)
         
         if hasattr(self.model, 'status'):
-            query = query.filter(getattr(self.model, 'status'))
+            query = query.filter(getattr(self.model, 'status') == True)  # noqa: E712
         
         results = query.all()
         logger.debug('Retrieved %d %s records', len(results), self.model.__name__)
         return results
 
+    def get_active_ids(self, ids: Sequence[int]) -> Set[int]:
+        """
+        Return which of the given IDs belong to active records (status=True).
+
+        Args:
+            ids (Sequence[int]): Primary keys to check.
+
+        Returns:
+            Set[int]: The subset of `ids` that exist and are active.
+        """
+        table = self.model.__table__
+        stmt = select(table.c.id).where(table.c.id.in_(ids))
+        if 'status' in table.c:
+            stmt = stmt.where(table.c.status == True)  # noqa: E712
+        return set(self.session.scalars(stmt))
+
+    def get_all_rows(self, columns: Sequence[str]) -> Sequence[Row[Any]]:
+        """
+        Retrieve the given columns of all active records (status=True) as Core rows.
+
+        Only the named columns are selected and no ORM instances are built, so
+        read paths that just copy fields into a schema skip identity-map and
+        attribute instrumentation work per row.
+
+        Args:
+            columns (Sequence[str]): Names of the table columns to select.
+
+        Returns:
+            Sequence[Row[Any]]: One row per active record, with attribute access by column name.
+        """
+        logger.debug('Retrieving %s columns of all %s records', columns, self.model.__name__)
+        table = self.model.__table__
+        stmt = select(*(table.c[name] for name in columns))
+
+        if 'status' in table.c:
+            stmt = stmt.where(table.c.status == True)  # noqa: E712
+
+        results = self.session.execute(stmt).all()
+        logger.debug('Retrieved %d %s rows', len(results), self.model.__name__)
+        return results
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Sequence[T]]:
+        """
+        Stream all active records (status=True) in batches from a server-side cursor.
+
+        Rows are fetched `batch_size` at a time with `yield_per`, so memory stays
+        bounded by the batch rather than the table. The session must stay open
+        until the iterator is exhausted.
+
+        Args:
+            batch_size (int): Number of rows fetched and yielded per batch. Defaults to 500.
+
+        Yields:
+            Iterator[Sequence[T]]: Successive batches of model instances.
+        """
+        logger.debug('Streaming %s records in batches of %d', self.model.__name__, batch_size)
+        stmt = select(self.model)
+
+        if hasattr(self.model, 'status'):
+            stmt = stmt.where(getattr(self.model, 'status') == True)  # noqa: E712
+
+        result = self.session.scalars(stmt.execution_options(yield_per=batch_size))
+        yield from result.partitions()
+
     def get_by_id(self, id: int) -> Optional[T]:
         """
         Retrieve a single record by its primary key, considering only active records (status=True).
 
+        Uses `Session.get`, which returns an instance already in the identity map
+        without a query and otherwise loads it by primary key; the status check
+        is applied to the loaded instance.
+
         Args:
             id (int): The primary key of the record to retrieve.
 
@@ -79,28 +183,29 @@ class BaseRepository(Generic[T, Schema]):
             Optional[T]: The model instance if found and active; otherwise, None.
         """
         logger.debug('Retrieving %s record with ID: %d (only active)', self.model.__name__, id)
-        query = self.session.query(self.model).filter(self.model.id == id)
+        result = self.session.get(self.model, id)
         
-        if hasattr(self.model, 'status'):
-            query = query.filter(getattr(self.model, 'status') == True)  # noqa: E712
+        if result is not None and hasattr(result, 'status') and not getattr(result, 'status'):
+            result = None
         
-        result = query.first()
         if result:
             logger.debug('%s record with ID %d found and active', self.model.__name__, id)
         else:
             logger.debug('%s record with ID %d not found or inactive', self.model.__name__, id)
         return result
 
-    def update(self, obj: T, obj_in: BaseModel) -> T:
+    def update(self, obj: T, obj_in: Union[BaseModel, Dict[str, Any]]) -> T:
         """
         Update an existing record with values provided by a Pydantic Schema.
 
         Only fields explicitly set in the schema will be updated (`exclude_unset=True`).
+        A dict is taken as an already-dumped set of changes. When there is nothing
+        to change the record is returned as is, without an UPDATE round trip.
         Only active records (status=True) can be updated.
 
         Args:
             obj (T): The SQLAlchemy model instance to update.
-            obj_in (Schema): A Pydantic schema containing the fields to update.
+            obj_in (Union[BaseModel, Dict[str, Any]]): A Pydantic schema, or the dict of fields, to update.
 
         Raises:
             ValueError: If the record is inactive (status=False) and cannot be updated.
@@ -112,13 +217,19 @@ class BaseRepository(Generic[T, Schema]):
             logger.warning('Cannot update %s record with ID %s because it is inactive', obj.__class__.__name__, getattr(obj, 'id', None))
             raise ValueError(f"Cannot update inactive {obj.__class__.__name__} record with ID {getattr(obj, 'id', None)}")
 
-        update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            logger.debug('No changes for %s record with ID %s; skipping update', obj.__class__.__name__, getattr(obj, 'id', None))
+            return obj
+
         logger.debug('Updating %s record with ID %s using data: %s', obj.__class__.__name__, getattr(obj, 'id', None), update_data)
         
-        for key, value in update_data.items():
-            setattr(obj, key, value)
+        # --- Relationship assignments may lazy-load; don't autoflush a half-applied update ---
+        with self.session.no_autoflush:
+            for key, value in update_data.items():
+                setattr(obj, key, value)
         
-        self.session.commit()
+        self.session.flush()
         self.session.refresh(obj)
         logger.debug('%s record with ID %s updated successfully', obj.__class__.__name__, getattr(obj, 'id', None))
         return obj
@@ -135,7 +246,7 @@ class BaseRepository(Generic[T, Schema]):
         """
         logger.debug('Deleting %s record with ID: %s', obj.__class__.__name__, getattr(obj, 'id', None))
         self.session.delete(obj)
-        self.session.commit()
+        self.session.flush()
         logger.debug('%s record with ID %s deleted successfully', obj.__class__.__name__, getattr(obj, 'id', None))
 
     def logical_delete(self, obj: T) -> None:
@@ -167,7 +278,7 @@ class BaseRepository(Generic[T, Schema]):
             if hasattr(obj, 'updated_by'):
                 setattr(obj, 'updated_by', 'system')
 
-            self.session.commit()
+            self.session.flush()
             logger.debug(
                 '%s record with ID %s logically deleted', 
                 obj.__class__.__name__, 
@@ -179,3 +290,110 @@ class BaseRepository(Generic[T, Schema]):
                 obj.__class__.__name__, 
                 getattr(obj, 'id', None)
             )
+
+    # --- Single-statement writes (no SELECT before the mutation) ---
+    def _where_active_id(self, stmt: Union[Select[Any], Update, Delete], id: int) -> Any:
+        """
+        Restrict a statement to the active record with the given primary key.
+
+        Args:
+            stmt (Union[Select[Any], Update, Delete]): Statement against the model's table.
+            id (int): The primary key of the targeted record.
+
+        Returns:
+            Any: The statement with the id (and status=True, when applicable) criteria.
+        """
+        table = self.model.__table__
+        stmt = stmt.where(table.c.id == id)
+        if 'status' in table.c:
+            stmt = stmt.where(table.c.status == True)  # noqa: E712
+        return stmt
+
+    def update_by_id(self, id: int, values: Dict[str, Any]) -> Optional[Row[Any]]:
+        """
+        Update an active record in one UPDATE ... RETURNING statement.
+
+        Args:
+            id (int): The primary key of the record to update.
+            values (Dict[str, Any]): Column values to set; must not be empty.
+
+        Returns:
+            Optional[Row[Any]]: The updated row with every column, or None if no active record matched.
+        """
+        logger.debug('Updating %s record with ID %s using data: %s', self.model.__name__, id, values)
+        table = self.model.__table__
+        stmt = self._where_active_id(update(table), id).values(**values).returning(*table.c)
+        return self.session.execute(stmt).first()
+
+    def delete_by_id(self, id: int) -> bool:
+        """
+        Delete an active record in one DELETE statement.
+
+        Args:
+            id (int): The primary key of the record to delete.
+
+        Returns:
+            bool: True if a record was deleted, False if no active record matched.
+        """
+        logger.debug('Deleting %s record with ID: %s', self.model.__name__, id)
+        result = self.session.execute(self._where_active_id(delete(self.model.__table__), id))
+        return result.rowcount > 0
+
+    def logical_delete_by_id(self, id: int) -> bool:
+        """
+        Logically delete an active record in one UPDATE statement.
+
+        Sets `status` to False and stamps `updated_at`/`updated_by` when the
+        model has them, like `logical_delete`, without loading the record first.
+
+        Args:
+            id (int): The primary key of the record to logically delete.
+
+        Returns:
+            bool: True if a record was marked inactive, False if no active record matched.
+        """
+        table = self.model.__table__
+        values: Dict[str, Any] = {'status': False}
+        if 'updated_at' in table.c:
+            values['updated_at'] = datetime.now(timezone.utc)
+        if 'updated_by' in table.c:
+            values['updated_by'] = 'system'
+
+        logger.debug('Logically deleting %s record with ID: %s', self.model.__name__, id)
+        result = self.session.execute(self._where_active_id(update(table), id).values(**values))
+        return result.rowcount > 0
+
+    # --- Versions for conditional requests (models with TimestampMixin) ---
+    def get_version(self, id: int) -> Optional[datetime]:
+        """
+        Return when an active record last changed, reading a single column.
+
+        Args:
+            id (int): The primary key of the record.
+
+        Returns:
+            Optional[datetime]: `updated_at`, or `created_at` if never updated; None if no active record matched.
+        """
+        table = self.model.__table__
+        stmt = self._where_active_id(select(func.coalesce(table.c.updated_at, table.c.created_at)), id)
+        return self.session.scalar(stmt)
+
+    def get_collection_version(self) -> Row[Any]:
+        """
+        Return an aggregate that changes whenever the set of active records changes.
+
+        Creations change the count and highest id, updates and logical deletions
+        move the latest timestamp, and hard deletions change the count.
+
+        Returns:
+            Row[Any]: `(count, max_id, last_changed)` over the active records.
+        """
+        table = self.model.__table__
+        stmt = select(
+            func.count(),
+            func.max(table.c.id),
+            func.max(func.coalesce(table.c.updated_at, table.c.created_at))
+        )
+        if 'status' in table.c:
+            stmt = stmt.where(table.c.status == True)  # noqa: E712
+        return self.session.execute(stmt).one()
@@ -1,11 +1,47 @@
-from sqlalchemy import insert, delete, select
+from functools import lru_cache
+from typing import Any, Sequence
+
+from sqlalchemy import func, insert, delete, select, true
 from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from app.core.logger import logger
 
+# --- Dialects whose INSERT supports ON CONFLICT DO NOTHING ---
+_UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+@lru_cache(maxsize=None)
+def _link_insert(association_table: Table, dialect_name: str) -> Any:
+    """
+    Build the INSERT used for links, once per association table and dialect.
+
+    Statements are immutable, so `.values()` on the cached one returns a copy.
+
+    Args:
+        association_table (Table): SQLAlchemy Table representing the association.
+        dialect_name (str): Name of the bound dialect, e.g. `sqlite`.
+
+    Returns:
+        Any: An INSERT statement without values, with ON CONFLICT DO NOTHING where supported.
+    """
+    upsert_insert = _UPSERT_INSERTS.get(dialect_name)
+    if upsert_insert is not None:
+        return upsert_insert(association_table).on_conflict_do_nothing()
+    return insert(association_table)
+
+
 class ManyToManyRepository:
-    """Repository for managing many-to-many association tables."""
+    """Repository for managing many-to-many association tables.
+
+    Statements run inside the request's transaction, which `DBSessionMiddleware` commits once.
+    """
+
+    __slots__ = ('session', 'association_table')
 
     def __init__(self, session: Session, association_table: Table):
         """
@@ -18,20 +54,73 @@ class ManyToManyRepository:
         self.session = session
         self.association_table = association_table
 
+    def _link_insert(self) -> Any:
+        """
+        Return the cached link INSERT for this table and the session's dialect.
+
+        Returns:
+            Any: An INSERT statement against the association table, without values.
+        """
+        return _link_insert(self.association_table, self.session.get_bind().dialect.name)
+
     def link(self, left_id: int, right_id: int, left_key: str, right_key: str) -> None:
         """
         Create a link between two entities in the association table.
 
+        Linking is idempotent: on dialects that support it the INSERT carries
+        ON CONFLICT DO NOTHING, so an existing link is left as is in a single
+        round trip instead of failing on the primary key.
+
         Args:
             left_id (int): ID of the first entity (e.g. agent_id).
             right_id (int): ID of the second entity (e.g. tool_id).
             left_key (str): Column name of the left entity.
             right_key (str): Column name of the right entity.
         """
-        stmt = insert(self.association_table).values({left_key: left_id, right_key: right_id})
+        stmt = self._link_insert().values({left_key: left_id, right_key: right_id})
         logger.debug('Linking %s=%s with %s=%s', left_key, left_id, right_key, right_id)
         self.session.execute(stmt)
-        self.session.commit()
+
+    def link_active(
+        self,
+        left_id: int,
+        right_ids: Sequence[int],
+        left_key: str,
+        right_key: str,
+        left_table: Table,
+        right_table: Table
+    ) -> int:
+        """
+        Link one entity to others only if all of them exist and are active.
+
+        The pairs are produced by an INSERT ... SELECT over the two entity
+        tables filtered on their IDs and, where the tables have one, on
+        `status`, so missing or logically deleted rows simply yield no pair.
+        Existing links are skipped where ON CONFLICT DO NOTHING is supported.
+
+        Args:
+            left_id (int): ID of the first entity (e.g. enterprise_id).
+            right_ids (Sequence[int]): IDs of the entities to link (e.g. ia_group_ids).
+            left_key (str): Column name of the left entity in the association table.
+            right_key (str): Column name of the right entity in the association table.
+            left_table (Table): Table of the left entity.
+            right_table (Table): Table of the right entity.
+
+        Returns:
+            int: Number of links inserted; lower than the number of distinct
+                `right_ids` when a row is missing, inactive or already linked.
+        """
+        pairs = (
+            select(left_table.c.id, right_table.c.id)
+            .select_from(left_table.join(right_table, true()))
+            .where(left_table.c.id == left_id, right_table.c.id.in_(right_ids))
+        )
+        for table in (left_table, right_table):
+            if 'status' in table.c:
+                pairs = pairs.where(table.c.status == True)  # noqa: E712
+        stmt = self._link_insert().from_select([left_key, right_key], pairs)
+        logger.debug('Linking %s=%s with active %s values %s', left_key, left_id, right_key, right_ids)
+        return self.session.execute(stmt).rowcount
 
     def unlink(self, left_id: int, right_id: int, left_key: str, right_key: str) -> None:
         """
@@ -53,12 +142,14 @@ class ManyToManyRepository:
         )
         logger.debug('Unlinking %s=%s from %s=%s', left_key, left_id, right_key, right_id)
         self.session.execute(stmt)
-        self.session.commit()
 
     def get_links(self, left_id: int, left_key: str, right_key: str) -> list[int]:
         """
         Retrieve all linked IDs of the second entity related to a given first entity.
 
+        On PostgreSQL the IDs are aggregated with `array_agg` into a single
+        row; other dialects return one row per link.
+
         Args:
             left_id (int): ID of the first entity (e.g., agent_id).
             left_key (str): Column name of the first entity in the association table.
@@ -67,11 +158,12 @@ class ManyToManyRepository:
         Returns:
             list[int]: A list of IDs of the second entity (e.g., tool_id) linked to the given first entity.
         """
-        stmt = (
-            select(getattr(self.association_table.c, right_key))
-            .where(getattr(self.association_table.c, left_key) == left_id)
-        )
-        result = self.session.execute(stmt).scalars().all()
-        result_int: list[int] = [int(r) for r in result]
-        logger.debug('Retrieved %d linked records for %s=%s', len(result_int), left_key, left_id)
-        return result_int
+        right_column = getattr(self.association_table.c, right_key)
+        condition = getattr(self.association_table.c, left_key) == left_id
+        if self.session.get_bind().dialect.name == 'postgresql':
+            # --- One row holding the whole list, decoded by the driver ---
+            links = self.session.execute(select(func.array_agg(right_column)).where(condition)).scalar_one() or []
+        else:
+            links = list(self.session.execute(select(right_column).where(condition)).scalars())
+        logger.debug('Retrieved %d linked records for %s=%s', len(links), left_key, left_id)
+        return links
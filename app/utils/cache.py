@@ -0,0 +1,115 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Small thread-safe in-process cache with per-entry expiry and LRU eviction.
+
+    Entries expire `ttl` seconds after they are stored; once `maxsize` entries
+    are held, the least recently used one is evicted. Sync endpoints run on a
+    threadpool, so every operation takes the lock.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept.
+        ttl (float): Lifetime of an entry, in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept.
+            ttl (float): Lifetime of an entry, in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Return the cached value for `key`, or None if missing or expired.
+
+        Args:
+            key (K): Cache key.
+
+        Returns:
+            Optional[V]: The cached value, if still fresh.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store `value` under `key`, evicting the least recently used entry if full.
+
+        Args:
+            key (K): Cache key.
+            value (V): Value to cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """
+        Drop the entry for `key`, if any.
+
+        Args:
+            key (K): Cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+# --- Invalidations deferred to the commit of the session that made the change ---
+_PENDING_INVALIDATIONS = 'pending_cache_invalidations'
+
+
+def invalidate_on_commit(session: Session, cache: TTLCache[Any, Any], key: Any) -> None:
+    """
+    Drop `key` from `cache` now and again once `session` commits.
+
+    A read on another thread between the change and the commit could otherwise
+    cache the old row again. The keys are kept in `session.info` and dropped by
+    a single `after_commit` listener, so nothing is registered per write.
+
+    Args:
+        session (Session): Session whose transaction carries the change.
+        cache (TTLCache[Any, Any]): Cache holding the changed entry.
+        key (Any): Cache key of the changed entry.
+    """
+    cache.invalidate(key)
+    session.info.setdefault(_PENDING_INVALIDATIONS, []).append((cache, key))
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed(session: Session) -> None:
+    """Drops every entry registered with `invalidate_on_commit` once its change is committed."""
+    pending: List[Tuple[TTLCache[Any, Any], Any]] = session.info.pop(_PENDING_INVALIDATIONS, [])
+    for cache, key in pending:
+        cache.invalidate(key)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_rolled_back(session: Session) -> None:
+    """Forgets pending invalidations whose change was rolled back."""
+    session.info.pop(_PENDING_INVALIDATIONS, None)
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak entity tag from the values that identify a resource version.
+
+    Datetimes are rendered in ISO 8601 so the tag never contains spaces.
+
+    Args:
+        *parts (Any): Values that change whenever the representation changes.
+
+    Returns:
+        str: The weak ETag, e.g. `W/"7-2025-01-01T12:00:00.123456"`.
+    """
+    rendered = (part.isoformat() if isinstance(part, datetime) else str(part) for part in parts)
+    return f'W/"{"-".join(rendered)}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an `If-None-Match` header against the current ETag (weak comparison).
+
+    Args:
+        if_none_match (Optional[str]): Raw header value; may list several tags or be `*`.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        bool: True if the client's cached representation is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    current = etag.removeprefix('W/')
+    return any(tag.strip().removeprefix('W/') == current for tag in if_none_match.split(','))
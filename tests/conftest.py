@@ -0,0 +1,26 @@
+import os
+import tempfile
+from typing import Iterator
+
+# --- Settings are read once at import, so point the app at a throwaway database first ---
+os.environ.setdefault('ENVIRONMENT', 'local')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ['DB_DIR'] = tempfile.mkdtemp(prefix='luminous-neural-tests-')
+os.environ['DB_FILE'] = 'test.db'
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope='session')
+def client() -> Iterator[TestClient]:
+    """
+    Provide a TestClient for the application, with its lifespan running.
+
+    Yields:
+        Iterator[TestClient]: Client bound to the application.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
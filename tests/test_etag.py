@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.utils.etag import etag_matches, make_etag
+
+
+# --- etag_matches ---
+@pytest.mark.parametrize('if_none_match, etag', [
+    ('W/"7-a"', 'W/"7-a"'),
+    ('"7-a"', 'W/"7-a"'),
+    ('W/"7-a"', '"7-a"'),
+    ('"1-x", W/"7-a"', 'W/"7-a"'),
+    ('*', 'W/"7-a"'),
+    (' * ', 'W/"7-a"'),
+])
+def test_etag_matches(if_none_match: str, etag: str) -> None:
+    assert etag_matches(if_none_match, etag)
+
+
+@pytest.mark.parametrize('if_none_match', [None, '', 'W/"7-b"', '"1-x", "2-y"'])
+def test_etag_does_not_match(if_none_match: str) -> None:
+    assert not etag_matches(if_none_match, 'W/"7-a"')
+
+
+def test_make_etag_renders_datetimes_in_iso_format() -> None:
+    assert make_etag(7, datetime(2025, 1, 1, 12, 0, 0, 123456)) == 'W/"7-2025-01-01T12:00:00.123456"'
+
+
+# --- Conditional requests on enterprises ---
+def _create_enterprise(client: TestClient, name: str) -> int:
+    response = client.post('/enterprise/', json={'name': name, 'description': 'An enterprise for ETags', 'ia_model': 'gpt-x'})
+    assert response.status_code == 201
+    return response.json()['data']['id']
+
+
+def test_if_none_match_returns_304(client: TestClient) -> None:
+    enterprise_id = _create_enterprise(client, 'EtagOne')
+    etag = client.get(f'/enterprise/{enterprise_id}').headers['etag']
+
+    response = client.get(f'/enterprise/{enterprise_id}', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.headers['etag'] == etag
+    assert not response.content
+
+
+def test_etag_changes_after_put(client: TestClient) -> None:
+    enterprise_id = _create_enterprise(client, 'EtagTwo')
+    etags = [client.get(f'/enterprise/{enterprise_id}').headers['etag']]
+
+    # --- Back-to-back updates must still yield distinct versions (updated_at has microseconds) ---
+    for name in ('EtagTwoA', 'EtagTwoB'):
+        updated = client.put(f'/enterprise/{enterprise_id}', json={'name': name})
+        assert updated.status_code == 200
+        assert updated.json()['data']['updated_at']
+        etags.append(client.get(f'/enterprise/{enterprise_id}').headers['etag'])
+
+    assert len(set(etags)) == 3
+    response = client.get(f'/enterprise/{enterprise_id}', headers={'If-None-Match': etags[0]})
+    assert response.status_code == 200
+    assert response.json()['data']['name'] == 'EtagTwoB'
+
+
+def test_list_etag_changes_after_create(client: TestClient) -> None:
+    etag = client.get('/enterprise/').headers['etag']
+    assert client.get('/enterprise/', headers={'If-None-Match': etag}).status_code == 304
+
+    _create_enterprise(client, 'EtagThree')
+
+    response = client.get('/enterprise/', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['etag'] != etag
+
+
+def test_missing_enterprise_is_404_even_with_wildcard(client: TestClient) -> None:
+    assert client.get('/enterprise/999999', headers={'If-None-Match': '*'}).status_code == 404
@@ -0,0 +1,111 @@
+from typing import Iterator, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.middleware import DBSessionMiddleware, request_session
+from app.core.sql_database import db
+from app.domains.enterprise.model import Enterprise
+from app.repositories.base import BaseRepository
+
+
+# --- Minimal app whose routes write through the request session ---
+_probe = FastAPI()
+_probe.add_middleware(DBSessionMiddleware)
+
+
+def _add_enterprise(name: str) -> None:
+    session = request_session.get()
+    session.add(Enterprise(name=name, description='Written by a probe route', ia_model='probe'))
+    session.flush()
+
+
+@_probe.post('/ok/{name}')
+def _write_ok(name: str) -> JSONResponse:
+    _add_enterprise(name)
+    return JSONResponse({'name': name}, status_code=201)
+
+
+@_probe.post('/client-error/{name}')
+def _write_client_error(name: str) -> JSONResponse:
+    _add_enterprise(name)
+    return JSONResponse({'name': name}, status_code=400)
+
+
+@_probe.post('/server-error/{name}')
+def _write_server_error(name: str) -> JSONResponse:
+    _add_enterprise(name)
+    raise RuntimeError('failure after the write')
+
+
+@_probe.get('/read/{name}')
+def _write_on_get(name: str) -> JSONResponse:
+    _add_enterprise(name)
+    return JSONResponse({'name': name})
+
+
+def _is_stored(name: str) -> bool:
+    with db.get_session() as session:
+        return session.scalar(select(Enterprise.id).where(Enterprise.name == name)) is not None
+
+
+@pytest.fixture(scope='module')
+def probe() -> Iterator[TestClient]:
+    with TestClient(_probe, raise_server_exceptions=False) as test_client:
+        yield test_client
+
+
+def test_successful_write_is_committed(probe: TestClient) -> None:
+    assert probe.post('/ok/mw-ok').status_code == 201
+    assert _is_stored('mw-ok')
+
+
+@pytest.mark.parametrize('path, status_code', [
+    ('/client-error/mw-4xx', 400),
+    ('/server-error/mw-5xx', 500),
+])
+def test_failed_write_is_rolled_back(probe: TestClient, path: str, status_code: int) -> None:
+    assert probe.post(path).status_code == status_code
+    assert not _is_stored(path.rsplit('/', 1)[1])
+
+
+def test_get_never_commits(probe: TestClient) -> None:
+    assert probe.get('/read/mw-get').status_code == 200
+    assert not _is_stored('mw-get')
+
+
+def test_stream_keeps_session_open_until_last_chunk(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    created = client.post('/agent/bulk', json=[
+        {'name': f'Streamed{i}', 'description': 'A streamed agent', 'system_message': 'Be helpful always'}
+        for i in range(3)
+    ])
+    assert created.status_code == 201
+
+    events: List[str] = []
+    iter_all = BaseRepository.iter_all
+    close = Session.close
+
+    def tracked_iter_all(self: BaseRepository, batch_size: int = 500):
+        for batch in iter_all(self, batch_size=1):
+            events.append('batch')
+            yield batch
+        events.append('exhausted')
+
+    def tracked_close(self: Session) -> None:
+        events.append('close')
+        close(self)
+
+    monkeypatch.setattr(BaseRepository, 'iter_all', tracked_iter_all)
+    monkeypatch.setattr(Session, 'close', tracked_close)
+
+    response = client.get('/agent/stream')
+
+    assert response.status_code == 200
+    streamed_names = {line for line in response.text.splitlines() if '"Streamed' in line}
+    assert len(streamed_names) == 3
+    assert events.count('batch') >= 3
+    assert events.index('close') > events.index('exhausted')
@@ -0,0 +1,6 @@
+from app.core.sql_database import discover_model_modules
+from app.domains._models_manifest import MODELS
+
+
+def test_manifest_lists_every_model_module() -> None:
+    assert sorted(MODELS) == sorted(discover_model_modules('app.domains'))